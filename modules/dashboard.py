@@ -4,15 +4,118 @@ Enhanced Terminal Dashboard for Bug Bounty Monitor
 Shows comprehensive data: subdomains, endpoints, technologies, Shodan, Wayback results
 """
 
+import copy
 import json
 import os
+import sys
+import re
+import heapq
+import time
+import concurrent.futures
 import yaml
 from pathlib import Path
-from datetime import datetime, timedelta
+from types import MappingProxyType
+from datetime import timedelta
 from collections import defaultdict, Counter
+from itertools import islice
 import curses
 import argparse
 
+# Shared read-only defaults for .get() lookups on parsed JSON
+_EMPTY_DICT = MappingProxyType({})
+_EMPTY_LIST = ()
+_NO_HOSTNAME = ('',)
+
+# orjson is optional: parses bytes directly and is several times faster
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj):
+        return json.dumps(obj).encode()
+
+
+# HTTP status code -> status_breakdown bucket
+_STATUS_BUCKET = ['other'] * 200 + [f"{code // 100}xx" for code in range(200, 600)]
+
+
+# Bump whenever a _summarize_* method changes the shape of its summary so
+# .dashboard_cache.json files written by older versions are discarded
+_SUMMARY_CACHE_VERSION = 1
+
+
+# Wayback sample priority -> icon (anything else renders as 🔵)
+_PRIORITY_ICONS = {'critical': "🔴", 'high': "🟡"}
+
+# Flag keywords marking an endpoint as a high-value target (matched lowercase)
+_HIGH_VALUE_FLAG_RE = re.compile(r'high-value|admin|upload')
+
+
+# scheme://[userinfo@]host -> host
+_HOST_RE = re.compile(r'^[a-z][a-z0-9+.-]*://(?:[^@/?#]*@)?(\[[^\]/?#]*\]|[^/:?#]+)', re.IGNORECASE)
+
+
+def _host(url):
+    """Extract the lowercase hostname from a URL ('' if it has none)"""
+    match = _HOST_RE.search(url)
+    return match.group(1).strip('[]').lower() if match else ''
+
+
+def _status_bucket(status_code):
+    """Map an HTTP status code to its '2xx'..'5xx' bucket ('other' if out of range)"""
+    if isinstance(status_code, int) and 0 < status_code < 600:
+        return _STATUS_BUCKET[status_code]
+    return 'other'
+
+
+def _read_json(path):
+    """Read and parse a JSON file"""
+    return _loads(Path(path).read_bytes())
+
+
+def _scan_domain(stem):
+    """Extract the domain from a '{domain}_{YYYYmmdd}_{HHMMSS}' scan file stem"""
+    # Same result as stem.rsplit('_', 2)[0] without building the list
+    end = stem.rfind('_')
+    if end == -1:
+        return stem
+    start = stem.rfind('_', 0, end)
+    return stem[:start] if start != -1 else stem[:end]
+
+
+def _latest_per_domain(entries, domain=None):
+    """Pick the most recent (mtime, path) scan file for each domain"""
+    domain_files = {}
+    for mtime, path in entries:
+        file_domain = _scan_domain(path.stem)
+        if domain and file_domain != domain:
+            continue
+
+        current = domain_files.get(file_domain)
+        if current is None or mtime > current[0]:
+            domain_files[file_domain] = (mtime, path)
+
+    return {dom: path for dom, (mtime, path) in domain_files.items()}
+
+
+def _scan_json_files(directory, prefix=''):
+    """List (mtime, path) for every *.json file (optionally starting with prefix)
+    in a directory with a single scandir pass"""
+    entries = []
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                name = entry.name
+                if name.startswith(prefix) and name.endswith('.json') and entry.is_file():
+                    entries.append((entry.stat().st_mtime, Path(entry.path)))
+    except OSError:
+        pass
+    return entries
+
+
 class Dashboard:
     def __init__(self, data_dir="./data", diff_dir=None, baseline_dir=None):
         self.data_dir = Path(data_dir)
@@ -22,39 +125,173 @@ class Dashboard:
         self.shodan_dir = self.data_dir / "shodan_scans"
         self.wayback_dir = self.data_dir / "wayback_scans"
 
+        # Shared pool for file loading (threads are started on first use)
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=8)
+
+        # Parsed JSON memo: path -> ((mtime_ns, size), data)
+        self._json_cache = {}
+        # Extracted Shodan/Wayback/diff summaries: path -> ((mtime_ns, size), summary),
+        # persisted to data_dir so the next CLI invocation starts warm
+        self._summary_cache_file = self.data_dir / ".dashboard_cache.json"
+        self._scan_cache = self._load_summary_cache()
+        self._scan_cache_dirty = False
+        # Aggregate statistics memo: (baseline signature + diff listing, valid_until, stats)
+        self._stats_cache = None
+        # Diff counts from the last get_statistics pass: path -> (mtime, counts)
+        self._diff_counts = {}
+        # Parsed baselines memo: (file count, max mtime_ns) -> baselines
+        self._baselines = None
+        self._baselines_signature = None
+        # Fused endpoint pass memo: domain -> (baselines, computed)
+        self._computed = {}
+        # Endpoint host index memo: domain -> (endpoints dict, {host: [urls]})
+        self._host_index = {}
+
+    def _load_json_cached(self, path, summarize=None):
+        """Load a JSON file, reusing the parsed data while its mtime and size are unchanged.
+
+        With ``summarize``, only ``summarize(data)`` is cached so the raw
+        document can be freed as soon as it has been extracted.
+        """
+        cache = self._json_cache if summarize is None else self._scan_cache
+        st = path.stat()
+        signature = (st.st_mtime_ns, st.st_size)
+        cached = cache.get(path)
+        if cached and cached[0] == signature:
+            return cached[1]
+
+        data = _read_json(path)
+        if summarize is not None:
+            data = summarize(data)
+            self._scan_cache_dirty = True
+        cache[path] = (signature, data)
+        return data
+
+    def _load_summary_cache(self):
+        """Load summaries persisted by a previous run (entries are revalidated by mtime/size).
+
+        A cache written with a different ``_SUMMARY_CACHE_VERSION`` is ignored.
+        """
+        try:
+            cache = _read_json(self._summary_cache_file)
+            if cache.get('version') != _SUMMARY_CACHE_VERSION:
+                return {}
+            return {Path(path): ((mtime_ns, size), summary)
+                    for path, (mtime_ns, size, summary) in cache['entries'].items()}
+        except Exception:
+            return {}
+
+    def _save_summary_cache(self):
+        """Persist new summaries, dropping entries for files that no longer exist"""
+        if not self._scan_cache_dirty or not self.data_dir.is_dir():
+            return
+
+        entries = {str(path): [signature[0], signature[1], summary]
+                   for path, (signature, summary) in self._scan_cache.items()
+                   if path.exists()}
+        tmp_file = self._summary_cache_file.with_suffix('.tmp')
+        try:
+            tmp_file.write_bytes(_dumps({'version': _SUMMARY_CACHE_VERSION, 'entries': entries}))
+            os.replace(tmp_file, self._summary_cache_file)
+            self._scan_cache_dirty = False
+        except Exception as e:
+            print(f"Error saving dashboard cache: {e}")
+
+    def _load_json_parallel(self, paths, summarize=None):
+        """Load several JSON files concurrently on the shared thread pool.
+
+        Returns a list of (path, data, error) tuples in the order of ``paths``;
+        ``error`` is the exception raised while loading, or None.
+        """
+        future_to_path = {self._executor.submit(self._load_json_cached, path, summarize): path
+                          for path in paths}
+
+        results = []
+        for future, path in future_to_path.items():
+            error = future.exception()
+            results.append((path, None if error else future.result(), error))
+        return results
+
     def get_all_baselines(self):
-        """Get all baseline data"""
-        baselines = {}
-        baseline_files = list(self.baseline_dir.glob("*_baseline.json"))
+        """Get all baseline data (a copy callers are free to modify)"""
+        return copy.deepcopy(self._get_baselines())
+
+    def _get_baselines(self):
+        """Get all baseline data (cached until a baseline file changes).
+
+        The returned dict is shared with the memo and must not be modified.
+        """
+        # One scandir pass yields the file list and the change signature
+        baseline_files = []
+        latest_mtime = 0
+        try:
+            with os.scandir(self.baseline_dir) as it:
+                for entry in it:
+                    if entry.name.endswith('_baseline.json') and entry.is_file():
+                        try:
+                            mtime = entry.stat().st_mtime_ns
+                        except OSError:
+                            continue  # Removed since the directory was listed
+                        baseline_files.append(Path(entry.path))
+                        latest_mtime = max(latest_mtime, mtime)
+        except OSError:
+            pass
+        signature = (len(baseline_files), latest_mtime)
+
+        if signature == self._baselines_signature:
+            return self._baselines
 
-        for baseline_file in baseline_files:
-            try:
-                domain = baseline_file.stem.replace('_baseline', '')
-                with open(baseline_file, 'r') as f:
-                    baselines[domain] = json.load(f)
-            except Exception as e:
-                print(f"Error loading {baseline_file}: {e}")
+        baselines = {}
+        for baseline_file, data, error in self._load_json_parallel(baseline_files):
+            if error:
+                print(f"Error loading {baseline_file}: {error}")
                 continue
-
+            domain = baseline_file.stem.replace('_baseline', '')
+            baselines[domain] = data
+
+        # Forget parsed files and per-domain memos for baselines that were removed
+        for path in self._json_cache.keys() - set(baseline_files):
+            del self._json_cache[path]
+        for dom in self._host_index.keys() - baselines.keys():
+            del self._host_index[dom]
+        self._computed.clear()
+
+        self._baselines = baselines
+        self._baselines_signature = signature
         return baselines
 
-    def get_subdomain_data(self, domain=None):
-        """Get detailed subdomain information"""
-        baselines = self.get_all_baselines()
-
+    def _iter_baselines(self, domain=None):
+        """Iterate (domain, baseline) pairs, restricted to one domain if it exists"""
+        baselines = self._get_baselines()
         if domain and domain in baselines:
-            baselines = {domain: baselines[domain]}
+            return ((domain, baselines[domain]),)
+        return baselines.items()
 
+    def _get_host_index(self, domain, endpoints):
+        """Group endpoint URLs by hostname (cached while the baseline is unchanged)"""
+        cached = self._host_index.get(domain)
+        if cached and cached[0] is endpoints:
+            return cached[1]
+
+        host_index = defaultdict(list)
+        for url in endpoints:
+            host_index[_host(url)].append(url)
+
+        self._host_index[domain] = (endpoints, host_index)
+        return host_index
+
+    def get_subdomain_data(self, domain=None):
+        """Get detailed subdomain information"""
         subdomain_data = []
 
-        for dom, baseline in baselines.items():
-            subdomains = baseline.get('subdomains', {})
-            endpoints = baseline.get('endpoints', {})
+        for dom, baseline in self._iter_baselines(domain):
+            subdomains = baseline.get('subdomains', _EMPTY_DICT)
+            endpoints = baseline.get('endpoints', _EMPTY_DICT)
+            host_index = self._get_host_index(dom, endpoints)
 
-            for subdomain in subdomains.keys():
-                # Find endpoints for this subdomain
-                sub_endpoints = [url for url in endpoints.keys()
-                               if subdomain in url]
+            for subdomain in subdomains:
+                # Find endpoints for this subdomain (host index keys are lowercase)
+                sub_endpoints = host_index.get(subdomain.lower(), [])
 
                 # Get status from endpoints
                 status = "Unknown"
@@ -62,7 +299,7 @@ class Dashboard:
                 for url in sub_endpoints:
                     if endpoints[url].get('status_code'):
                         status_code = endpoints[url]['status_code']
-                        status = "Live" if 200 <= status_code < 400 else "Error"
+                        status = "Live" if _status_bucket(status_code) in ('2xx', '3xx') else "Error"
                         break
 
                 subdomain_data.append({
@@ -77,15 +314,10 @@ class Dashboard:
 
     def get_endpoint_data(self, domain=None):
         """Get detailed endpoint information"""
-        baselines = self.get_all_baselines()
-
-        if domain and domain in baselines:
-            baselines = {domain: baselines[domain]}
-
         endpoint_data = []
 
-        for dom, baseline in baselines.items():
-            endpoints = baseline.get('endpoints', {})
+        for dom, baseline in self._iter_baselines(domain):
+            endpoints = baseline.get('endpoints', _EMPTY_DICT)
 
             for url, data in endpoints.items():
                 endpoint_data.append({
@@ -94,48 +326,31 @@ class Dashboard:
                     'status_code': data.get('status_code', 'N/A'),
                     'title': data.get('title', 'N/A'),
                     'content_length': data.get('body_length', 0),
-                    'technologies': ', '.join(data.get('technologies', [])),
+                    'technologies': ', '.join(data.get('technologies', _EMPTY_LIST)),
                     'server': data.get('server', 'N/A'),
-                    'flags': data.get('flags', [])
+                    'flags': data.get('flags', _EMPTY_LIST)
                 })
 
         return endpoint_data
 
-    def get_technology_stats(self, domain=None):
-        """Get technology statistics"""
-        baselines = self.get_all_baselines()
-
-        if domain and domain in baselines:
-            baselines = {domain: baselines[domain]}
+    def _compute_all(self, domain=None):
+        """Walk every endpoint once, collecting overview counts, technology
+        counters and security findings together (memoized per domain while
+        the cached baselines are unchanged)"""
+        baselines = self._get_baselines()
+        cached = self._computed.get(domain)
+        if cached and cached[0] is baselines:
+            return cached[1]
 
+        overview = {
+            'total_subdomains': 0,
+            'total_endpoints': 0,
+            'live_endpoints': 0,
+            'status_breakdown': {'2xx': 0, '3xx': 0, '4xx': 0, '5xx': 0, 'other': 0}
+        }
         tech_counter = Counter()
         server_counter = Counter()
-
-        for dom, baseline in baselines.items():
-            endpoints = baseline.get('endpoints', {})
-
-            for url, data in endpoints.items():
-                # Count technologies
-                for tech in data.get('technologies', []):
-                    tech_counter[tech] += 1
-
-                # Count servers
-                server = data.get('server', 'Unknown')
-                if server and server != 'N/A':
-                    server_counter[server] += 1
-
-        return {
-            'technologies': dict(tech_counter.most_common(20)),
-            'servers': dict(server_counter.most_common(10))
-        }
-
-    def get_security_findings(self, domain=None):
-        """Get security findings"""
-        baselines = self.get_all_baselines()
-
-        if domain and domain in baselines:
-            baselines = {domain: baselines[domain]}
-
+        status_counts = Counter()
         findings = {
             'subdomain_takeovers': [],
             'high_value_targets': [],
@@ -143,9 +358,11 @@ class Dashboard:
             'error_pages': []
         }
 
-        for dom, baseline in baselines.items():
+        high_value_search = _HIGH_VALUE_FLAG_RE.search
+
+        for dom, baseline in self._iter_baselines(domain):
             # Subdomain takeovers
-            takeovers = baseline.get('subdomain_takeovers', [])
+            takeovers = baseline.get('subdomain_takeovers', _EMPTY_LIST)
             for takeover in takeovers:
                 findings['subdomain_takeovers'].append({
                     'domain': dom,
@@ -154,13 +371,38 @@ class Dashboard:
                     'confidence': takeover.get('confidence', 'N/A')
                 })
 
-            # High-value targets and errors
-            endpoints = baseline.get('endpoints', {})
+            overview['total_subdomains'] += len(baseline.get('subdomains', _EMPTY_DICT))
+            endpoints = baseline.get('endpoints', _EMPTY_DICT)
+            overview['total_endpoints'] += len(endpoints)
+            techs = []
+            servers = []
+
             for url, data in endpoints.items():
+                status_code = data.get('status_code', 0)
+                bucket = _status_bucket(status_code)
+                if status_code:
+                    status_counts[bucket] += 1
+
+                # Collect technologies and servers for counting
+                techs.extend(data.get('technologies', _EMPTY_LIST))
+                server = data.get('server', 'Unknown')
+                if server and server != 'N/A':
+                    servers.append(server)
+
                 # High-value targets
-                flags = data.get('flags', [])
-                if any('high-value' in str(flag).lower() or 'admin' in str(flag).lower()
-                       or 'upload' in str(flag).lower() for flag in flags):
+                flags = data.get('flags', _EMPTY_LIST)
+                is_high_value = False
+                outdated_flag = None
+                for flag in flags:
+                    flag_lower = str(flag).lower()
+                    if not is_high_value and high_value_search(flag_lower):
+                        is_high_value = True
+                    if outdated_flag is None and 'outdated' in flag_lower:
+                        outdated_flag = flag
+                    if is_high_value and outdated_flag is not None:
+                        break
+
+                if is_high_value:
                     findings['high_value_targets'].append({
                         'domain': dom,
                         'url': url,
@@ -169,24 +411,106 @@ class Dashboard:
                     })
 
                 # Outdated technology
-                if any('outdated' in str(flag).lower() for flag in flags):
+                if outdated_flag is not None:
                     findings['outdated_tech'].append({
                         'domain': dom,
                         'url': url,
-                        'technologies': data.get('technologies', []),
-                        'flag': next((f for f in flags if 'outdated' in str(f).lower()), '')
+                        'technologies': data.get('technologies', _EMPTY_LIST),
+                        'flag': outdated_flag
                     })
 
                 # Error pages (5xx)
-                status_code = data.get('status_code', 0)
-                if 500 <= status_code < 600:
+                if bucket == '5xx':
                     findings['error_pages'].append({
                         'domain': dom,
                         'url': url,
                         'status_code': status_code
                     })
 
-        return findings
+            # Count technologies and servers once per domain
+            tech_counter.update(techs)
+            server_counter.update(servers)
+
+        overview['live_endpoints'] = sum(status_counts.values())
+        overview['status_breakdown'].update(status_counts)
+
+        computed = {
+            'overview': overview,
+            'tech_counter': tech_counter,
+            'server_counter': server_counter,
+            'findings': findings
+        }
+        self._computed[domain] = (baselines, computed)
+        return computed
+
+    def get_technology_stats(self, domain=None):
+        """Get technology statistics"""
+        computed = self._compute_all(domain)
+
+        return {
+            'technologies': dict(computed['tech_counter'].most_common(20)),
+            'servers': dict(computed['server_counter'].most_common(10))
+        }
+
+    def get_security_findings(self, domain=None):
+        """Get security findings (a copy callers are free to modify)"""
+        return copy.deepcopy(self._compute_all(domain)['findings'])
+
+    def _summarize_shodan(self, data):
+        """Extract the dashboard findings from a parsed Shodan scan"""
+        findings = {
+            'open_ports': [],
+            'vulnerabilities': [],
+            'services': [],
+            'high_value': []
+        }
+
+        # Parse hosts data
+        hosts = data.get('hosts', _EMPTY_DICT)
+        for ip, host_data in hosts.items():
+            # Extract open ports
+            ports = host_data.get('ports', _EMPTY_LIST)
+            if ports:
+                findings['open_ports'].append({
+                    'ip': ip,
+                    'ports': ports[:10]  # First 10 ports
+                })
+
+            # Extract vulnerabilities
+            vulns = host_data.get('vulns', _EMPTY_LIST)
+            for vuln in vulns[:3]:  # First 3 CVEs per host
+                findings['vulnerabilities'].append({
+                    'ip': ip,
+                    'cve': vuln,
+                    'hostname': (host_data.get('hostnames') or _NO_HOSTNAME)[0]
+                })
+
+            # Extract services
+            services = host_data.get('data', _EMPTY_LIST)
+            for service in services[:3]:  # First 3 services per host
+                findings['services'].append({
+                    'ip': ip,
+                    'port': service.get('port'),
+                    'service': service.get('product', 'Unknown'),
+                    'version': service.get('version', '')
+                })
+
+            # High-value findings
+            if host_data.get('high_value'):
+                findings['high_value'].append({
+                    'ip': ip,
+                    'reason': host_data.get('high_value_reason', 'Unknown'),
+                    'hostname': (host_data.get('hostnames') or _NO_HOSTNAME)[0]
+                })
+
+        summary = data.get('summary', _EMPTY_DICT)
+        return {
+            'total_hosts': summary.get('total_hosts', 0),
+            'with_vulnerabilities': summary.get('with_vulnerabilities', 0),
+            'high_value_hosts': summary.get('high_value_hosts', 0),
+            'scanned_at': data.get('timestamp', 'N/A'),
+            'findings': findings
+        }
 
     def get_shodan_data(self, domain=None):
         """Get Shodan scan results with detailed findings"""
@@ -194,80 +518,47 @@ class Dashboard:
             return {}
 
         shodan_data = {}
-        shodan_files = list(self.shodan_dir.glob("*.json"))
 
         # Get most recent file for each domain
-        domain_files = {}
-        for file in shodan_files:
-            file_domain = file.stem.rsplit('_', 1)[0]
-            if domain and file_domain != domain:
+        domain_files = _latest_per_domain(_scan_json_files(self.shodan_dir), domain)
+
+        # Only the extracted findings are cached; raw host dumps are dropped after parsing
+        loaded = self._load_json_parallel(list(domain_files.values()), summarize=self._summarize_shodan)
+        for dom, (file, summary, error) in zip(domain_files, loaded):
+            if error:
                 continue
+            shodan_data[dom] = copy.deepcopy(summary)
 
-            if file_domain not in domain_files or os.path.getmtime(file) > os.path.getmtime(domain_files[file_domain]):
-                domain_files[file_domain] = file
+        return shodan_data
 
-        for dom, file in domain_files.items():
-            try:
-                with open(file, 'r') as f:
-                    data = json.load(f)
-
-                    # Extract detailed findings
-                    findings = {
-                        'open_ports': [],
-                        'vulnerabilities': [],
-                        'services': [],
-                        'high_value': []
+    def _summarize_wayback(self, data):
+        """Extract statistics and top sample URLs from a parsed Wayback scan"""
+        stats = data.get('statistics', _EMPTY_DICT)
+        categorized = data.get('categorized', _EMPTY_DICT)
+
+        # Extract sample URLs from each category
+        category_samples = {}
+        for category, items in categorized.items():
+            if items:
+                # Get top 5 URLs by score
+                top_items = heapq.nlargest(5, items, key=lambda x: x.get('score', 0))
+                category_samples[category] = [
+                    {
+                        'url': item.get('url', ''),
+                        'priority': item.get('priority', 'low'),
+                        'score': item.get('score', 0)
                     }
+                    for item in top_items
+                ]
 
-                    # Parse hosts data
-                    hosts = data.get('hosts', {})
-                    for ip, host_data in hosts.items():
-                        # Extract open ports
-                        ports = host_data.get('ports', [])
-                        if ports:
-                            findings['open_ports'].append({
-                                'ip': ip,
-                                'ports': ports[:10]  # First 10 ports
-                            })
-
-                        # Extract vulnerabilities
-                        vulns = host_data.get('vulns', [])
-                        for vuln in vulns[:3]:  # First 3 CVEs per host
-                            findings['vulnerabilities'].append({
-                                'ip': ip,
-                                'cve': vuln,
-                                'hostname': host_data.get('hostnames', [''])[0]
-                            })
-
-                        # Extract services
-                        services = host_data.get('data', [])
-                        for service in services[:3]:  # First 3 services per host
-                            findings['services'].append({
-                                'ip': ip,
-                                'port': service.get('port'),
-                                'service': service.get('product', 'Unknown'),
-                                'version': service.get('version', '')
-                            })
-
-                        # High-value findings
-                        if host_data.get('high_value'):
-                            findings['high_value'].append({
-                                'ip': ip,
-                                'reason': host_data.get('high_value_reason', 'Unknown'),
-                                'hostname': host_data.get('hostnames', [''])[0]
-                            })
-
-                    shodan_data[dom] = {
-                        'total_hosts': data.get('summary', {}).get('total_hosts', 0),
-                        'with_vulnerabilities': data.get('summary', {}).get('with_vulnerabilities', 0),
-                        'high_value_hosts': data.get('summary', {}).get('high_value_hosts', 0),
-                        'scanned_at': data.get('timestamp', 'N/A'),
-                        'findings': findings
-                    }
-            except Exception as e:
-                continue
-
-        return shodan_data
+        return {
+            'total_urls': data.get('total_urls', 0),
+            'critical': stats.get('by_priority', _EMPTY_DICT).get('critical', 0),
+            'high': stats.get('by_priority', _EMPTY_DICT).get('high', 0),
+            'categories': dict(stats.get('by_category', _EMPTY_DICT)),
+            'category_samples': category_samples,
+            'scanned_at': data.get('timestamp', 'N/A')
+        }
 
     def get_wayback_data(self, domain=None):
         """Get Wayback Machine results with sample URLs per category"""
@@ -275,230 +566,230 @@ class Dashboard:
             return {}
 
         wayback_data = {}
-        wayback_files = list(self.wayback_dir.glob("*[0-9].json"))  # Exclude category files
+        wayback_files = [(mtime, path) for mtime, path in _scan_json_files(self.wayback_dir)
+                         if path.stem[-1:].isdigit()]  # Exclude category files
 
         # Get most recent file for each domain
-        domain_files = {}
-        for file in wayback_files:
-            file_domain = file.stem.rsplit('_', 1)[0]
-            if domain and file_domain != domain:
-                continue
+        domain_files = _latest_per_domain(wayback_files, domain)
 
-            if file_domain not in domain_files or os.path.getmtime(file) > os.path.getmtime(domain_files[file_domain]):
-                domain_files[file_domain] = file
-
-        for dom, file in domain_files.items():
-            try:
-                with open(file, 'r') as f:
-                    data = json.load(f)
-                    stats = data.get('statistics', {})
-                    categorized = data.get('categorized', {})
-
-                    # Extract sample URLs from each category
-                    category_samples = {}
-                    for category, items in categorized.items():
-                        if items:
-                            # Get top 5 URLs by score
-                            sorted_items = sorted(items, key=lambda x: x.get('score', 0), reverse=True)
-                            category_samples[category] = [
-                                {
-                                    'url': item.get('url', ''),
-                                    'priority': item.get('priority', 'low'),
-                                    'score': item.get('score', 0)
-                                }
-                                for item in sorted_items[:5]
-                            ]
-
-                    wayback_data[dom] = {
-                        'total_urls': data.get('total_urls', 0),
-                        'critical': stats.get('by_priority', {}).get('critical', 0),
-                        'high': stats.get('by_priority', {}).get('high', 0),
-                        'categories': stats.get('by_category', {}),
-                        'category_samples': category_samples,
-                        'scanned_at': data.get('timestamp', 'N/A')
-                    }
-            except Exception as e:
+        # Only the top samples per category are cached, not every archived URL
+        loaded = self._load_json_parallel(list(domain_files.values()), summarize=self._summarize_wayback)
+        for dom, (file, summary, error) in zip(domain_files, loaded):
+            if error:
                 continue
+            wayback_data[dom] = copy.deepcopy(summary)
 
         return wayback_data
 
-    def get_statistics(self):
-        """Calculate comprehensive statistics"""
-        baselines = self.get_all_baselines()
+    def _summarize_diff(self, changes):
+        """Reduce a parsed diff file to the change counts used by get_statistics"""
+        counts = {key: len(changes.get(key, _EMPTY_LIST))
+                  for key in ('new_subdomains', 'new_endpoints', 'changed_endpoints', 'new_js_endpoints')}
+        counts['total'] = sum(counts.values())
+        return counts
+
+    def get_statistics(self, domain=None):
+        """Calculate comprehensive statistics, optionally for a single domain
+        (a copy callers are free to modify)"""
+        return copy.deepcopy(self._get_statistics(domain))
+
+    def _get_statistics(self, domain=None):
+        """Calculate statistics (cached until the baselines or diffs change).
+
+        The returned dict is shared with the memo and must not be modified.
+        """
+        baselines = self._get_baselines()
+        if domain not in baselines:
+            domain = None
+
+        # 50 most recent diff files, newest first (only the domain's own files when filtering)
+        diff_prefix = f"{domain}_" if domain else ''
+        diff_entries = heapq.nlargest(50, _scan_json_files(self.diff_dir, diff_prefix))
+
+        # Unchanged files reuse the last result until a diff ages out of a change window
+        cache_key = (domain, self._baselines_signature, tuple(diff_entries))
+        if (self._stats_cache and self._stats_cache[0] == cache_key
+                and time.time() < self._stats_cache[1]):
+            return self._stats_cache[2]
+
+        # Count from baselines
+        overview = self._compute_all(domain)['overview']
 
         stats = {
-            'total_targets': len(baselines),
-            'total_subdomains': 0,
-            'total_endpoints': 0,
-            'live_endpoints': 0,
-            'status_breakdown': {'2xx': 0, '3xx': 0, '4xx': 0, '5xx': 0, 'other': 0},
-            'changes_24h': defaultdict(int),
-            'changes_7d': defaultdict(int),
+            'total_targets': 1 if domain else len(baselines),
+            'total_subdomains': overview['total_subdomains'],
+            'total_endpoints': overview['total_endpoints'],
+            'live_endpoints': overview['live_endpoints'],
+            'status_breakdown': dict(overview['status_breakdown']),
+            'changes_24h': Counter(),
+            'changes_7d': Counter(),
             'recent_changes': []
         }
 
-        # Count from baselines
-        for domain, baseline in baselines.items():
-            stats['total_subdomains'] += len(baseline.get('subdomains', {}))
-            endpoints = baseline.get('endpoints', {})
-            stats['total_endpoints'] += len(endpoints)
+        # Analyze changes (window boundaries as epoch floats, compared to st_mtime)
+        now = time.time()
+        day_ago = now - timedelta(days=1).total_seconds()
+        week_ago = now - timedelta(days=7).total_seconds()
+
+        # Reuse counts for diffs unchanged since the last pass and load the rest
+        # concurrently; files that left the top 50 are dropped from the memo
+        previous_counts = self._diff_counts
+        diff_counts = {}
+        stale = []
+        for mtime, diff_file in diff_entries:
+            cached = previous_counts.get(diff_file)
+            if cached and cached[0] == mtime:
+                diff_counts[diff_file] = cached
+            else:
+                stale.append((mtime, diff_file))
+
+        loaded = self._load_json_parallel([diff_file for _, diff_file in stale], summarize=self._summarize_diff)
+        for (mtime, diff_file), (_, counts, error) in zip(stale, loaded):
+            if not error:
+                diff_counts[diff_file] = (mtime, counts)
+        self._diff_counts = diff_counts
+
+        windows = ((day_ago, stats['changes_24h']), (week_ago, stats['changes_7d']))
+        valid_until = float('inf')
+
+        for mtime, diff_file in diff_entries:
+            if diff_file not in diff_counts:
+                continue
 
-            # Count status codes
-            for url, data in endpoints.items():
-                status_code = data.get('status_code', 0)
-                if status_code:
-                    stats['live_endpoints'] += 1
-                    if 200 <= status_code < 300:
-                        stats['status_breakdown']['2xx'] += 1
-                    elif 300 <= status_code < 400:
-                        stats['status_breakdown']['3xx'] += 1
-                    elif 400 <= status_code < 500:
-                        stats['status_breakdown']['4xx'] += 1
-                    elif 500 <= status_code < 600:
-                        stats['status_breakdown']['5xx'] += 1
-                    else:
-                        stats['status_breakdown']['other'] += 1
-
-        # Analyze changes
-        now = datetime.now()
-        day_ago = now - timedelta(days=1)
-        week_ago = now - timedelta(days=7)
-
-        diff_files = sorted(self.diff_dir.glob("*.json"), key=os.path.getmtime, reverse=True)
-
-        for diff_file in diff_files[:50]:
             try:
-                file_time = datetime.fromtimestamp(os.path.getmtime(diff_file))
-                with open(diff_file, 'r') as f:
-                    changes = json.load(f)
-
-                    change_count = sum([
-                        len(changes.get('new_subdomains', [])),
-                        len(changes.get('new_endpoints', [])),
-                        len(changes.get('changed_endpoints', [])),
-                        len(changes.get('new_js_endpoints', []))
-                    ])
-
-                    if change_count > 0:
-                        domain = diff_file.stem.rsplit('_', 2)[0]
-
-                        if len(stats['recent_changes']) < 20:
-                            stats['recent_changes'].append({
-                                'domain': domain,
-                                'time': file_time.strftime("%Y-%m-%d %H:%M"),
-                                'changes': changes,
-                                'total': change_count
-                            })
-
-                        if file_time > day_ago:
-                            stats['changes_24h']['new_subdomains'] += len(changes.get('new_subdomains', []))
-                            stats['changes_24h']['new_endpoints'] += len(changes.get('new_endpoints', []))
-
-                        if file_time > week_ago:
-                            stats['changes_7d']['new_subdomains'] += len(changes.get('new_subdomains', []))
-                            stats['changes_7d']['new_endpoints'] += len(changes.get('new_endpoints', []))
+                counts = diff_counts[diff_file][1]
+                change_count = counts['total']
+
+                if change_count > 0:
+                    if len(stats['recent_changes']) < 20:
+                        stats['recent_changes'].append({
+                            'domain': domain or _scan_domain(diff_file.stem),
+                            'time': time.strftime("%Y-%m-%d %H:%M", time.localtime(mtime)),
+                            'changes': counts,
+                            'total': change_count
+                        })
+
+                    window_update = {
+                        'new_subdomains': counts['new_subdomains'],
+                        'new_endpoints': counts['new_endpoints']
+                    }
+                    for window_start, window_counts in windows:
+                        if mtime > window_start:
+                            window_counts.update(window_update)
+                            valid_until = min(valid_until, mtime + (now - window_start))
 
             except Exception as e:
                 continue
 
+        self._stats_cache = (cache_key, valid_until, stats)
         return stats
 
     def render_simple(self, domain=None, view='overview'):
         """Enhanced text-based dashboard with multiple views"""
-        print("\n" + "="*100)
-        print(" " * 35 + "BUG BOUNTY MONITORING DASHBOARD")
-        print("="*100)
-        print()
+        # Lines are collected and written to stdout in one call
+        out = []
+        out.append("\n" + "="*100)
+        out.append(" " * 35 + "BUG BOUNTY MONITORING DASHBOARD")
+        out.append("="*100)
+        out.append("")
+
+        # Computed once per render and handed to the sections that need it
+        stats = self._get_statistics(domain) if view in ('overview', 'all') else None
 
         if view == 'overview':
-            self._render_overview(domain)
+            self._render_overview(out, domain, stats=stats)
         elif view == 'subdomains':
-            self._render_subdomains(domain)
+            self._render_subdomains(out, domain)
         elif view == 'endpoints':
-            self._render_endpoints(domain)
+            self._render_endpoints(out, domain)
         elif view == 'technologies':
-            self._render_technologies(domain)
+            self._render_technologies(out, domain)
         elif view == 'security':
-            self._render_security(domain)
+            self._render_security(out, domain)
         elif view == 'shodan':
-            self._render_shodan(domain)
+            self._render_shodan(out, domain)
         elif view == 'wayback':
-            self._render_wayback(domain)
+            self._render_wayback(out, domain)
         elif view == 'all':
-            self._render_overview(domain)
-            self._render_security(domain)
-            self._render_technologies(domain)
+            self._render_overview(out, domain, stats=stats)
+            self._render_security(out, domain, findings=self._compute_all(domain)['findings'])
+            self._render_technologies(out, domain, tech_stats=self.get_technology_stats(domain))
             if self.shodan_dir.exists():
-                self._render_shodan(domain)
+                self._render_shodan(out, domain)
             if self.wayback_dir.exists():
-                self._render_wayback(domain)
+                self._render_wayback(out, domain)
 
-        print("="*100)
-        print(f"Last Updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print("="*100)
-        print()
+        out.append("="*100)
+        out.append(f"Last Updated: {time.strftime('%Y-%m-%d %H:%M:%S')}")
+        out.append("="*100)
+        out.append("")
 
-    def _render_overview(self, domain=None):
+        sys.stdout.write('\n'.join(out) + '\n')
+        self._save_summary_cache()
+
+    def _render_overview(self, out, domain=None, stats=None):
         """Render overview section"""
-        stats = self.get_statistics()
+        if stats is None:
+            stats = self._get_statistics(domain)
 
         filter_text = f" (Domain: {domain})" if domain else ""
 
-        print(f"📊 OVERVIEW{filter_text}")
-        print("-" * 100)
-        print(f"  Targets:           {stats['total_targets']}")
-        print(f"  Total Subdomains:  {stats['total_subdomains']}")
-        print(f"  Total Endpoints:   {stats['total_endpoints']}")
-        print(f"  Live Endpoints:    {stats['live_endpoints']}")
-        print()
-
-        print("📈 HTTP STATUS DISTRIBUTION")
-        print("-" * 100)
-        print(f"  2xx (Success):      {stats['status_breakdown']['2xx']:4d}  {'█' * min(50, stats['status_breakdown']['2xx'])}")
-        print(f"  3xx (Redirect):     {stats['status_breakdown']['3xx']:4d}  {'█' * min(50, stats['status_breakdown']['3xx'])}")
-        print(f"  4xx (Client Error): {stats['status_breakdown']['4xx']:4d}  {'█' * min(50, stats['status_breakdown']['4xx'])}")
-        print(f"  5xx (Server Error): {stats['status_breakdown']['5xx']:4d}  {'█' * min(50, stats['status_breakdown']['5xx'])}")
-        print()
-
-        print("⏰ CHANGES - LAST 24 HOURS")
-        print("-" * 100)
-        print(f"  New Subdomains:    {stats['changes_24h']['new_subdomains']}")
-        print(f"  New Endpoints:     {stats['changes_24h']['new_endpoints']}")
-        print()
-
-        print("📅 CHANGES - LAST 7 DAYS")
-        print("-" * 100)
-        print(f"  New Subdomains:    {stats['changes_7d']['new_subdomains']}")
-        print(f"  New Endpoints:     {stats['changes_7d']['new_endpoints']}")
-        print()
-
-    def _render_subdomains(self, domain=None):
+        out.append(f"📊 OVERVIEW{filter_text}")
+        out.append("-" * 100)
+        out.append(f"  Targets:           {stats['total_targets']}")
+        out.append(f"  Total Subdomains:  {stats['total_subdomains']}")
+        out.append(f"  Total Endpoints:   {stats['total_endpoints']}")
+        out.append(f"  Live Endpoints:    {stats['live_endpoints']}")
+        out.append("")
+
+        out.append("📈 HTTP STATUS DISTRIBUTION")
+        out.append("-" * 100)
+        out.append(f"  2xx (Success):      {stats['status_breakdown']['2xx']:4d}  {'█' * min(50, stats['status_breakdown']['2xx'])}")
+        out.append(f"  3xx (Redirect):     {stats['status_breakdown']['3xx']:4d}  {'█' * min(50, stats['status_breakdown']['3xx'])}")
+        out.append(f"  4xx (Client Error): {stats['status_breakdown']['4xx']:4d}  {'█' * min(50, stats['status_breakdown']['4xx'])}")
+        out.append(f"  5xx (Server Error): {stats['status_breakdown']['5xx']:4d}  {'█' * min(50, stats['status_breakdown']['5xx'])}")
+        out.append("")
+
+        out.append("⏰ CHANGES - LAST 24 HOURS")
+        out.append("-" * 100)
+        out.append(f"  New Subdomains:    {stats['changes_24h']['new_subdomains']}")
+        out.append(f"  New Endpoints:     {stats['changes_24h']['new_endpoints']}")
+        out.append("")
+
+        out.append("📅 CHANGES - LAST 7 DAYS")
+        out.append("-" * 100)
+        out.append(f"  New Subdomains:    {stats['changes_7d']['new_subdomains']}")
+        out.append(f"  New Endpoints:     {stats['changes_7d']['new_endpoints']}")
+        out.append("")
+
+    def _render_subdomains(self, out, domain=None):
         """Render subdomain listing"""
         subdomain_data = self.get_subdomain_data(domain)
 
-        print(f"🌐 SUBDOMAIN LISTING ({len(subdomain_data)} total)")
-        print("-" * 100)
-        print(f"  {'Subdomain':<50} {'Status':<10} {'Code':<10} {'Endpoints':<10}")
-        print("  " + "-" * 98)
+        out.append(f"🌐 SUBDOMAIN LISTING ({len(subdomain_data)} total)")
+        out.append("-" * 100)
+        out.append(f"  {'Subdomain':<50} {'Status':<10} {'Code':<10} {'Endpoints':<10}")
+        out.append("  " + "-" * 98)
 
-        # Sort by status (Live first, then by name)
-        subdomain_data.sort(key=lambda x: (x['status'] != 'Live', x['subdomain']))
+        # First 50 by status (Live first, then by name)
+        top_subdomains = heapq.nsmallest(50, subdomain_data,
+                                         key=lambda x: (x['status'] != 'Live', x['subdomain']))
 
-        for i, sub in enumerate(subdomain_data[:50]):  # Show first 50
+        for sub in top_subdomains:
             status_icon = "✓" if sub['status'] == 'Live' else "✗"
             code_str = str(sub['status_code']) if sub['status_code'] else "N/A"
-            print(f"  {status_icon} {sub['subdomain']:<47} {sub['status']:<10} {code_str:<10} {sub['endpoint_count']:<10}")
+            out.append(f"  {status_icon} {sub['subdomain']:<47} {sub['status']:<10} {code_str:<10} {sub['endpoint_count']:<10}")
 
         if len(subdomain_data) > 50:
-            print(f"\n  ... and {len(subdomain_data) - 50} more subdomains")
-        print()
+            out.append(f"\n  ... and {len(subdomain_data) - 50} more subdomains")
+        out.append("")
 
-    def _render_endpoints(self, domain=None):
+    def _render_endpoints(self, out, domain=None):
         """Render endpoint listing"""
         endpoint_data = self.get_endpoint_data(domain)
 
-        print(f"🔗 ENDPOINT LISTING ({len(endpoint_data)} total)")
-        print("-" * 100)
+        out.append(f"🔗 ENDPOINT LISTING ({len(endpoint_data)} total)")
+        out.append("-" * 100)
 
         # Group by status code
         by_status = defaultdict(list)
@@ -506,204 +797,211 @@ class Dashboard:
             status = ep['status_code']
             by_status[status].append(ep)
 
+        # Bucket the integer status codes by class once, in sorted order
+        codes_by_bucket = defaultdict(list)
+        for code in sorted(s for s in by_status if isinstance(s, int)):
+            codes_by_bucket[_status_bucket(code)].append(code)
+
         # Show successful endpoints (2xx)
-        if any(200 <= s < 300 for s in by_status.keys() if isinstance(s, int)):
-            print("  ✅ 2XX - SUCCESS")
-            for code in sorted([s for s in by_status.keys() if isinstance(s, int) and 200 <= s < 300]):
+        if codes_by_bucket['2xx']:
+            out.append("  ✅ 2XX - SUCCESS")
+            for code in codes_by_bucket['2xx']:
                 endpoints = by_status[code][:10]  # First 10 per code
                 for ep in endpoints:
                     tech_str = ep['technologies'][:60] if ep['technologies'] else "N/A"
-                    print(f"    [{code}] {ep['url']:<70}")
+                    out.append(f"    [{code}] {ep['url']:<70}")
                     if tech_str != "N/A":
-                        print(f"           Tech: {tech_str}")
+                        out.append(f"           Tech: {tech_str}")
                     if ep['flags']:
-                        print(f"           Flags: {', '.join(str(f) for f in ep['flags'][:3])}")
+                        out.append(f"           Flags: {', '.join(str(f) for f in ep['flags'][:3])}")
 
         # Show redirects (3xx)
-        if any(300 <= s < 400 for s in by_status.keys() if isinstance(s, int)):
-            print("\n  ↩️  3XX - REDIRECTS")
-            for code in sorted([s for s in by_status.keys() if isinstance(s, int) and 300 <= s < 400]):
+        if codes_by_bucket['3xx']:
+            out.append("\n  ↩️  3XX - REDIRECTS")
+            for code in codes_by_bucket['3xx']:
                 count = len(by_status[code])
-                print(f"    [{code}] {count} endpoint(s)")
+                out.append(f"    [{code}] {count} endpoint(s)")
 
         # Show client errors (4xx)
-        if any(400 <= s < 500 for s in by_status.keys() if isinstance(s, int)):
-            print("\n  ❌ 4XX - CLIENT ERRORS")
-            for code in sorted([s for s in by_status.keys() if isinstance(s, int) and 400 <= s < 500]):
+        if codes_by_bucket['4xx']:
+            out.append("\n  ❌ 4XX - CLIENT ERRORS")
+            for code in codes_by_bucket['4xx']:
                 endpoints = by_status[code][:5]
                 for ep in endpoints:
-                    print(f"    [{code}] {ep['url']}")
+                    out.append(f"    [{code}] {ep['url']}")
 
         # Show server errors (5xx)
-        if any(500 <= s < 600 for s in by_status.keys() if isinstance(s, int)):
-            print("\n  🔴 5XX - SERVER ERRORS")
-            for code in sorted([s for s in by_status.keys() if isinstance(s, int) and 500 <= s < 600]):
+        if codes_by_bucket['5xx']:
+            out.append("\n  🔴 5XX - SERVER ERRORS")
+            for code in codes_by_bucket['5xx']:
                 for ep in by_status[code]:
-                    print(f"    [{code}] {ep['url']}")
+                    out.append(f"    [{code}] {ep['url']}")
 
-        print()
+        out.append("")
 
-    def _render_technologies(self, domain=None):
+    def _render_technologies(self, out, domain=None, tech_stats=None):
         """Render technology statistics"""
-        tech_stats = self.get_technology_stats(domain)
+        if tech_stats is None:
+            tech_stats = self.get_technology_stats(domain)
 
-        print("💻 TECHNOLOGY STACK")
-        print("-" * 100)
+        out.append("💻 TECHNOLOGY STACK")
+        out.append("-" * 100)
 
         if tech_stats['technologies']:
-            print("  Top Technologies:")
-            for tech, count in list(tech_stats['technologies'].items())[:15]:
+            out.append("  Top Technologies:")
+            for tech, count in islice(tech_stats['technologies'].items(), 15):
                 bar = '█' * min(40, count)
-                print(f"    {tech:<30} {count:4d}  {bar}")
+                out.append(f"    {tech:<30} {count:4d}  {bar}")
         else:
-            print("  No technology data available")
+            out.append("  No technology data available")
 
-        print()
+        out.append("")
 
         if tech_stats['servers']:
-            print("  Web Servers:")
-            for server, count in list(tech_stats['servers'].items())[:10]:
+            out.append("  Web Servers:")
+            for server, count in islice(tech_stats['servers'].items(), 10):
                 bar = '█' * min(40, count)
-                print(f"    {server:<30} {count:4d}  {bar}")
+                out.append(f"    {server:<30} {count:4d}  {bar}")
 
-        print()
+        out.append("")
 
-    def _render_security(self, domain=None):
+    def _render_security(self, out, domain=None, findings=None):
         """Render security findings"""
-        findings = self.get_security_findings(domain)
+        if findings is None:
+            findings = self._compute_all(domain)['findings']
 
-        print("🔒 SECURITY FINDINGS")
-        print("-" * 100)
+        out.append("🔒 SECURITY FINDINGS")
+        out.append("-" * 100)
 
         # Subdomain takeovers
         if findings['subdomain_takeovers']:
-            print(f"  ⚠️  SUBDOMAIN TAKEOVERS ({len(findings['subdomain_takeovers'])})")
+            out.append(f"  ⚠️  SUBDOMAIN TAKEOVERS ({len(findings['subdomain_takeovers'])})")
             for takeover in findings['subdomain_takeovers'][:10]:
-                print(f"    • {takeover['subdomain']} ({takeover['service']}) - Confidence: {takeover['confidence']}")
+                out.append(f"    • {takeover['subdomain']} ({takeover['service']}) - Confidence: {takeover['confidence']}")
         else:
-            print("  ✓ No subdomain takeovers detected")
+            out.append("  ✓ No subdomain takeovers detected")
 
-        print()
+        out.append("")
 
         # High-value targets
         if findings['high_value_targets']:
-            print(f"  🎯 HIGH-VALUE TARGETS ({len(findings['high_value_targets'])})")
+            out.append(f"  🎯 HIGH-VALUE TARGETS ({len(findings['high_value_targets'])})")
             for target in findings['high_value_targets'][:15]:
                 flags_str = ', '.join(str(f) for f in target['flags'][:2])
-                print(f"    [{target['status_code']}] {target['url']}")
-                print(f"           {flags_str}")
+                out.append(f"    [{target['status_code']}] {target['url']}")
+                out.append(f"           {flags_str}")
         else:
-            print("  No high-value targets flagged")
+            out.append("  No high-value targets flagged")
 
-        print()
+        out.append("")
 
         # Outdated technology
         if findings['outdated_tech']:
-            print(f"  🔧 OUTDATED TECHNOLOGY ({len(findings['outdated_tech'])})")
+            out.append(f"  🔧 OUTDATED TECHNOLOGY ({len(findings['outdated_tech'])})")
             for tech in findings['outdated_tech'][:10]:
-                print(f"    • {tech['url']}")
-                print(f"      {tech['flag']}")
+                out.append(f"    • {tech['url']}")
+                out.append(f"      {tech['flag']}")
 
-        print()
+        out.append("")
 
         # Server errors
         if findings['error_pages']:
-            print(f"  🔴 SERVER ERRORS (5xx) ({len(findings['error_pages'])})")
+            out.append(f"  🔴 SERVER ERRORS (5xx) ({len(findings['error_pages'])})")
             for error in findings['error_pages'][:10]:
-                print(f"    [{error['status_code']}] {error['url']}")
+                out.append(f"    [{error['status_code']}] {error['url']}")
 
-        print()
+        out.append("")
 
-    def _render_shodan(self, domain=None):
+    def _render_shodan(self, out, domain=None):
         """Render Shodan results with detailed findings"""
         shodan_data = self.get_shodan_data(domain)
 
-        print("🛰️  SHODAN INTELLIGENCE")
-        print("-" * 100)
+        out.append("🛰️  SHODAN INTELLIGENCE")
+        out.append("-" * 100)
 
         if shodan_data:
             for dom, data in shodan_data.items():
-                print(f"  Domain: {dom}")
-                print(f"    Hosts Scanned:       {data['total_hosts']}")
-                print(f"    With Vulnerabilities: {data['with_vulnerabilities']}")
-                print(f"    High-Value Hosts:    {data['high_value_hosts']}")
-                print(f"    Scanned At:          {data['scanned_at']}")
-                print()
+                out.append(f"  Domain: {dom}")
+                out.append(f"    Hosts Scanned:       {data['total_hosts']}")
+                out.append(f"    With Vulnerabilities: {data['with_vulnerabilities']}")
+                out.append(f"    High-Value Hosts:    {data['high_value_hosts']}")
+                out.append(f"    Scanned At:          {data['scanned_at']}")
+                out.append("")
 
                 # Show vulnerabilities found
-                if data.get('findings', {}).get('vulnerabilities'):
+                if data.get('findings', _EMPTY_DICT).get('vulnerabilities'):
                     vulns = data['findings']['vulnerabilities']
-                    print(f"  🔴 VULNERABILITIES FOUND ({len(vulns)})")
+                    out.append(f"  🔴 VULNERABILITIES FOUND ({len(vulns)})")
                     displayed = 0
                     for vuln in vulns:
                         if displayed >= 10:  # Limit to 10
                             remaining = len(vulns) - displayed
-                            print(f"    ... and {remaining} more")
+                            out.append(f"    ... and {remaining} more")
                             break
                         hostname = vuln.get('hostname', 'N/A')
-                        print(f"    • {vuln['cve']} on {vuln['ip']} ({hostname})")
+                        out.append(f"    • {vuln['cve']} on {vuln['ip']} ({hostname})")
                         displayed += 1
-                    print()
+                    out.append("")
 
                 # Show high-value findings
-                if data.get('findings', {}).get('high_value'):
+                if data.get('findings', _EMPTY_DICT).get('high_value'):
                     hv = data['findings']['high_value']
-                    print(f"  🎯 HIGH-VALUE FINDINGS ({len(hv)})")
+                    out.append(f"  🎯 HIGH-VALUE FINDINGS ({len(hv)})")
                     for finding in hv[:8]:  # Show first 8
                         hostname = finding.get('hostname', 'N/A')
-                        print(f"    • {finding['ip']} ({hostname})")
-                        print(f"      → {finding['reason']}")
+                        out.append(f"    • {finding['ip']} ({hostname})")
+                        out.append(f"      → {finding['reason']}")
                     if len(hv) > 8:
-                        print(f"    ... and {len(hv) - 8} more")
-                    print()
+                        out.append(f"    ... and {len(hv) - 8} more")
+                    out.append("")
 
                 # Show interesting services
-                if data.get('findings', {}).get('services'):
+                if data.get('findings', _EMPTY_DICT).get('services'):
                     services = data['findings']['services']
-                    print(f"  🔧 SERVICES DETECTED ({len(services)})")
+                    out.append(f"  🔧 SERVICES DETECTED ({len(services)})")
                     displayed = 0
                     for svc in services:
                         if displayed >= 12:  # Limit to 12
                             remaining = len(services) - displayed
-                            print(f"    ... and {remaining} more services")
+                            out.append(f"    ... and {remaining} more services")
                             break
                         version = f" {svc['version']}" if svc.get('version') else ""
-                        print(f"    • {svc['ip']}:{svc['port']} - {svc['service']}{version}")
+                        out.append(f"    • {svc['ip']}:{svc['port']} - {svc['service']}{version}")
                         displayed += 1
-                    print()
+                    out.append("")
 
                 # Show open ports summary
-                if data.get('findings', {}).get('open_ports'):
+                if data.get('findings', _EMPTY_DICT).get('open_ports'):
                     ports = data['findings']['open_ports']
-                    print(f"  🔌 OPEN PORTS ({len(ports)} hosts)")
+                    out.append(f"  🔌 OPEN PORTS ({len(ports)} hosts)")
                     for port_info in ports[:5]:  # Show first 5 hosts
                         ports_str = ', '.join(map(str, port_info['ports']))
-                        print(f"    • {port_info['ip']}: {ports_str}")
+                        out.append(f"    • {port_info['ip']}: {ports_str}")
                     if len(ports) > 5:
-                        print(f"    ... and {len(ports) - 5} more hosts")
-                    print()
+                        out.append(f"    ... and {len(ports) - 5} more hosts")
+                    out.append("")
 
         else:
-            print("  No Shodan data available")
-            print("  Enable Shodan scanning in config.yaml to gather network intelligence")
+            out.append("  No Shodan data available")
+            out.append("  Enable Shodan scanning in config.yaml to gather network intelligence")
 
-        print()
+        out.append("")
 
-    def _render_wayback(self, domain=None):
+    def _render_wayback(self, out, domain=None):
         """Render Wayback Machine results with sample URLs"""
         wayback_data = self.get_wayback_data(domain)
 
-        print("📜 WAYBACK MACHINE RESULTS")
-        print("-" * 100)
+        out.append("📜 WAYBACK MACHINE RESULTS")
+        out.append("-" * 100)
 
         if wayback_data:
             for dom, data in wayback_data.items():
-                print(f"  Domain: {dom}")
-                print(f"    Total URLs:     {data['total_urls']}")
-                print(f"    Critical URLs:  {data['critical']}")
-                print(f"    High Priority:  {data['high']}")
-                print(f"    Scanned At:     {data['scanned_at']}")
-                print()
+                out.append(f"  Domain: {dom}")
+                out.append(f"    Total URLs:     {data['total_urls']}")
+                out.append(f"    Critical URLs:  {data['critical']}")
+                out.append(f"    High Priority:  {data['high']}")
+                out.append(f"    Scanned At:     {data['scanned_at']}")
+                out.append("")
 
                 # Display high-value categories with sample URLs
                 if data.get('category_samples'):
@@ -715,42 +1013,42 @@ class Dashboard:
                     for cat in priority_cats:
                         if cat in samples and samples[cat]:
                             urls = samples[cat]
-                            print(f"  🔍 {cat.upper().replace('_', ' ')} ({len(urls)} samples)")
+                            out.append(f"  🔍 {cat.upper().replace('_', ' ')} ({len(urls)} samples)")
                             for url_data in urls[:3]:  # Show top 3 per category
-                                priority_icon = "🔴" if url_data['priority'] == 'critical' else "🟡" if url_data['priority'] == 'high' else "🔵"
-                                print(f"    {priority_icon} [{url_data['priority']}] Score: {url_data['score']}")
+                                priority_icon = _PRIORITY_ICONS.get(url_data['priority'], "🔵")
+                                out.append(f"    {priority_icon} [{url_data['priority']}] Score: {url_data['score']}")
                                 # Truncate long URLs
                                 url = url_data['url']
                                 if len(url) > 85:
                                     url = url[:82] + "..."
-                                print(f"       {url}")
+                                out.append(f"       {url}")
                             if len(urls) > 3:
-                                print(f"    ... and {len(urls) - 3} more")
-                            print()
+                                out.append(f"    ... and {len(urls) - 3} more")
+                            out.append("")
 
                     # Show other categories summary
                     other_cats = [cat for cat in samples.keys() if cat not in priority_cats and samples[cat]]
                     if other_cats:
-                        print(f"  📋 OTHER CATEGORIES")
+                        out.append(f"  📋 OTHER CATEGORIES")
                         for cat in other_cats[:5]:
                             count = len(samples[cat])
-                            print(f"    • {cat}: {count} URLs")
+                            out.append(f"    • {cat}: {count} URLs")
                         if len(other_cats) > 5:
-                            print(f"    ... and {len(other_cats) - 5} more categories")
-                        print()
+                            out.append(f"    ... and {len(other_cats) - 5} more categories")
+                        out.append("")
 
                 elif data.get('categories'):
                     # Fallback to old display if no samples
-                    print(f"  📋 TOP CATEGORIES:")
-                    for cat, count in list(data['categories'].items())[:8]:
-                        print(f"    • {cat}: {count}")
-                    print()
+                    out.append(f"  📋 TOP CATEGORIES:")
+                    for cat, count in islice(data['categories'].items(), 8):
+                        out.append(f"    • {cat}: {count}")
+                    out.append("")
 
         else:
-            print("  No Wayback data available")
-            print("  Enable Wayback scanning in config.yaml to discover historical URLs")
+            out.append("  No Wayback data available")
+            out.append("  Enable Wayback scanning in config.yaml to discover historical URLs")
 
-        print()
+        out.append("")
 
 def load_config(config_path):
     """Load configuration from YAML file"""
@@ -786,13 +1084,12 @@ def main():
             data_dir = monitoring.get('data_dir', './data')
             baseline_dir = monitoring.get('baseline_dir')
             diff_dir = monitoring.get('diff_dir')
-            print(f"[*] Using config: {args.config}")
-            print(f"[*] Data directory: {data_dir}")
+            banner = [f"[*] Using config: {args.config}", f"[*] Data directory: {data_dir}"]
             if baseline_dir:
-                print(f"[*] Baseline directory: {baseline_dir}")
+                banner.append(f"[*] Baseline directory: {baseline_dir}")
             if diff_dir:
-                print(f"[*] Diff directory: {diff_dir}")
-            print()
+                banner.append(f"[*] Diff directory: {diff_dir}")
+            sys.stdout.write('\n'.join(banner) + '\n\n')
 
     # Override with --data-dir if specified
     if args.data_dir:
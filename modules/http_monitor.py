@@ -11,13 +11,126 @@ import json
 import requests
 import hashlib
 import re
+import html
 from pathlib import Path
 from typing import Dict, List, Set, Any, Optional
 from urllib.parse import urlparse
 import subprocess
-from bs4 import BeautifulSoup
 from datetime import datetime
 
+# orjson is optional: snapshots are written and parsed as bytes several times faster
+try:
+    import orjson
+
+    def _dumps_indented(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps_indented(obj):
+        return json.dumps(obj, indent=2).encode()
+
+    _loads = json.loads
+
+# Response headers kept in results: the ones read by detection, flagging and reports
+_KEPT_HEADERS = (
+    'Server', 'Content-Type', 'X-Powered-By', 'X-AspNet-Version', 'X-AspNetMvc-Version',
+    'X-Generator', 'X-Drupal-Cache', 'X-Drupal-Dynamic-Cache',
+    'X-Frame-Options', 'X-Content-Type-Options', 'Strict-Transport-Security', 'Content-Security-Policy'
+)
+
+# Page title, searched for in the head of the raw body
+_TITLE_RE = re.compile(rb'<title[^>]*>([^<]*)</title>', re.IGNORECASE)
+_TITLE_SCAN_BYTES = 65536
+
+# Charset declared in the Content-Type header, or in a <meta charset> / http-equiv tag
+_HEADER_CHARSET_RE = re.compile(r'charset=["\']?([\w.:-]+)', re.IGNORECASE)
+_META_CHARSET_RE = re.compile(rb'<meta[^>]+charset=["\']?([\w.:-]+)', re.IGNORECASE)
+
+
+def _decode_title(raw: bytes, content_type: str, head: bytes) -> str:
+    """Decode title bytes with the page's declared charset, else UTF-8, else a detected one"""
+    declared = _HEADER_CHARSET_RE.search(content_type)
+    if declared:
+        candidates = [declared.group(1)]
+    else:
+        declared = _META_CHARSET_RE.search(head, 0, _TITLE_SCAN_BYTES)
+        candidates = [declared.group(1).decode('ascii')] if declared else []
+    candidates.append('utf-8')
+
+    for encoding in candidates:
+        try:
+            return raw.decode(encoding)
+        except (LookupError, UnicodeDecodeError):
+            continue
+
+    # Undeclared and not UTF-8: guess from the head, as requests' apparent_encoding does
+    detected = requests.compat.chardet.detect(head[:_TITLE_SCAN_BYTES]).get('encoding')
+    try:
+        return raw.decode(detected or 'utf-8', 'replace')
+    except LookupError:
+        return raw.decode('utf-8', 'replace')
+
+# Technology fingerprints are only searched for in the first screens of markup responses
+_TECH_SCAN_BYTES = 262144
+_MARKUP_TYPES = frozenset({'text/html', 'text/xml', 'application/xhtml+xml', 'application/xml'})
+# Only HTML pages have a page title; feeds, sitemaps and SOAP bodies are not searched
+_TITLE_TYPES = frozenset({'text/html', 'application/xhtml+xml'})
+
+# Bodies are streamed in chunks; only the part scanned for title/tech detection is kept
+_BODY_CHUNK_BYTES = 65536
+_BODY_KEEP_BYTES = _TECH_SCAN_BYTES
+
+# Version fingerprints matched against the lowercased page body
+_WORDPRESS_VERSION_RE = re.compile(rb'wordpress[/\s]+(\d+\.\d+(?:\.\d+)?)')
+_JQUERY_VERSION_RE = re.compile(rb'jquery[/-]?(\d+\.\d+\.\d+)')
+_BOOTSTRAP_VERSION_RE = re.compile(rb'bootstrap[/-]?(\d+\.\d+\.\d+)')
+
+# High-value keywords to flag (checked in order; the first hit per category is reported)
+_HIGH_VALUE_KEYWORDS = {
+    'admin': ('admin', 'administrator', 'console', 'dashboard', 'panel', 'manage'),
+    'auth': ('login', 'signin', 'authenticate', 'auth', 'sso', 'oauth'),
+    'backup': ('backup', 'bak', 'old', 'archive', 'dump', 'sql'),
+    'dev': ('dev', 'development', 'test', 'staging', 'debug', 'beta'),
+    'api': ('api', 'graphql', 'rest', 'endpoint', 'swagger', 'docs'),
+    'upload': ('upload', 'uploader', 'file', 'attachment', 'media'),
+    'sensitive': ('config', 'env', 'secret', 'key', 'token', 'password'),
+    'internal': ('internal', 'private', 'corp', 'vpn', 'intranet')
+}
+
+# Outdated/vulnerable technology versions
+_OUTDATED_TECH = {
+    'Apache': ('2.4.49', '2.4.50'),  # Path traversal CVEs
+    'nginx': ('1.18.0', '1.19.0'),
+    'PHP': ('7.3', '7.4', '5.6'),
+    'WordPress': ('5.8', '5.9'),
+    'jQuery': ('1.', '2.', '3.0', '3.1', '3.2'),
+    'Drupal': ('7.', '8.'),
+    'Joomla': ('3.',),
+    'IIS': ('8.5', '10.0')
+}
+# Lowercased vendor names for matching against detected technology strings
+_OUTDATED_TECH_LOWER = tuple((name.lower(), versions) for name, versions in _OUTDATED_TECH.items())
+
+# Status code meanings
+_INTERESTING_STATUSES = {
+    200: 'OK',
+    201: 'Created',
+    204: 'No Content',
+    301: 'Moved Permanently',
+    302: 'Found (Redirect)',
+    307: 'Temporary Redirect',
+    308: 'Permanent Redirect',
+    400: 'Bad Request',
+    401: 'Unauthorized',
+    403: 'Forbidden',
+    404: 'Not Found',
+    405: 'Method Not Allowed',
+    500: 'Internal Server Error',
+    502: 'Bad Gateway',
+    503: 'Service Unavailable'
+}
+
 class Colors:
     RED = '\033[91m'
     GREEN = '\033[92m'
@@ -29,52 +142,28 @@ class Colors:
     BOLD = '\033[1m'
 
 class HTTPMonitor:
-    def __init__(self, output_dir: str = "./http_data"):
+    def __init__(self, output_dir: str = "./http_data", max_workers: int = 20,
+                 keep_redirect_chain: bool = False):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
-
-        # High-value keywords to flag
-        self.high_value_keywords = {
-            'admin': ['admin', 'administrator', 'console', 'dashboard', 'panel', 'manage'],
-            'auth': ['login', 'signin', 'authenticate', 'auth', 'sso', 'oauth'],
-            'backup': ['backup', 'bak', 'old', 'archive', 'dump', 'sql'],
-            'dev': ['dev', 'development', 'test', 'staging', 'debug', 'beta'],
-            'api': ['api', 'graphql', 'rest', 'endpoint', 'swagger', 'docs'],
-            'upload': ['upload', 'uploader', 'file', 'attachment', 'media'],
-            'sensitive': ['config', 'env', 'secret', 'key', 'token', 'password'],
-            'internal': ['internal', 'private', 'corp', 'vpn', 'intranet']
-        }
-
-        # Outdated/vulnerable technology versions
-        self.outdated_tech = {
-            'Apache': ['2.4.49', '2.4.50'],  # Path traversal CVEs
-            'nginx': ['1.18.0', '1.19.0'],
-            'PHP': ['7.3', '7.4', '5.6'],
-            'WordPress': ['5.8', '5.9'],
-            'jQuery': ['1.', '2.', '3.0', '3.1', '3.2'],
-            'Drupal': ['7.', '8.'],
-            'Joomla': ['3.'],
-            'IIS': ['8.5', '10.0']
-        }
-
-        # Status code meanings
-        self.interesting_statuses = {
-            200: 'OK',
-            201: 'Created',
-            204: 'No Content',
-            301: 'Moved Permanently',
-            302: 'Found (Redirect)',
-            307: 'Temporary Redirect',
-            308: 'Permanent Redirect',
-            400: 'Bad Request',
-            401: 'Unauthorized',
-            403: 'Forbidden',
-            404: 'Not Found',
-            405: 'Method Not Allowed',
-            500: 'Internal Server Error',
-            502: 'Bad Gateway',
-            503: 'Service Unavailable'
-        }
+        self.max_workers = max_workers
+        # Results record the hop count and final URL; the full hop list only on request
+        self.keep_redirect_chain = keep_redirect_chain
+
+        # Shared session: pooled keep-alive connections are reused by every probe and worker thread
+        # (at least one pooled connection per worker so none are discarded under load)
+        self.session = requests.Session()
+        pool_size = max(50, max_workers)
+        adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({'User-Agent': 'Mozilla/5.0 (Security Scanner)'})
+        self.session.verify = False
+
+        # Shared, module-level tables (treat as read-only)
+        self.high_value_keywords = _HIGH_VALUE_KEYWORDS
+        self.outdated_tech = _OUTDATED_TECH
+        self.interesting_statuses = _INTERESTING_STATUSES
 
     def probe_url(self, url: str, timeout: int = 10) -> Dict[str, Any]:
         """Probe a single URL and extract all information"""
@@ -87,7 +176,8 @@ class HTTPMonitor:
             'technologies': [],
             'headers': {},
             'server': '',
-            'redirects': [],
+            'redirect_count': 0,
+            'final_url': url,
             'content_hash': '',
             'flags': [],
             'reachable': False
@@ -95,36 +185,57 @@ class HTTPMonitor:
 
         try:
             # Make request with redirect tracking
-            session = requests.Session()
-            response = session.get(
+            response = self.session.get(
                 url,
                 timeout=timeout,
                 allow_redirects=True,
-                verify=False,
-                headers={'User-Agent': 'Mozilla/5.0 (Security Scanner)'}
+                stream=True
             )
 
+            # Stream the body: hash and count all of it, keep only the head
+            body_hash = hashlib.sha256()
+            body_length = 0
+            body = bytearray()
+            try:
+                for chunk in response.iter_content(_BODY_CHUNK_BYTES):
+                    body_hash.update(chunk)
+                    body_length += len(chunk)
+                    if len(body) < _BODY_KEEP_BYTES:
+                        body += chunk[:_BODY_KEEP_BYTES - len(body)]
+            finally:
+                response.close()
+            body = bytes(body)
+
             result['status_code'] = response.status_code
-            result['body_length'] = len(response.content)
-            result['headers'] = dict(response.headers)
+            result['body_length'] = body_length
+            headers = response.headers
+            result['headers'] = {name: headers[name] for name in _KEPT_HEADERS if name in headers}
             result['server'] = response.headers.get('Server', '')
             result['reachable'] = True
 
             # Track redirects
             if response.history:
-                result['redirects'] = [r.url for r in response.history]
+                result['redirect_count'] = len(response.history)
+                result['final_url'] = response.url
+                if self.keep_redirect_chain:
+                    result['redirects'] = [r.url for r in response.history]
 
             # Content hash for change detection
-            result['content_hash'] = hashlib.sha256(response.content).hexdigest()
+            result['content_hash'] = body_hash.hexdigest()
 
             # Extract title
-            if 'text/html' in response.headers.get('Content-Type', ''):
-                soup = BeautifulSoup(response.content, 'html.parser')
-                if soup.title:
-                    result['title'] = soup.title.string.strip() if soup.title.string else ''
+            content_type = response.headers.get('Content-Type', '')
+            media_type = content_type.split(';', 1)[0].strip().lower()
+            if media_type in _TITLE_TYPES:
+                title_match = _TITLE_RE.search(body, 0, _TITLE_SCAN_BYTES)
+                if title_match:
+                    title = _decode_title(title_match.group(1), content_type, body)
+                    result['title'] = html.unescape(title).strip()
 
             # Detect technologies using httpx-style detection
-            result['technologies'] = self.detect_technologies(response)
+            # (non-markup bodies such as JSON, images and binaries only get the header checks)
+            is_markup = media_type in _MARKUP_TYPES
+            result['technologies'] = self.detect_technologies(response, body if is_markup else b'')
 
             # Flag high-value targets
             result['flags'] = self.flag_target(url, result)
@@ -138,8 +249,12 @@ class HTTPMonitor:
 
         return result
 
-    def detect_technologies(self, response: requests.Response) -> List[str]:
-        """Detect technologies from headers and content"""
+    def detect_technologies(self, response: requests.Response,
+                            body: Optional[bytes] = None) -> List[str]:
+        """Detect technologies from headers and content
+
+        body is the (possibly truncated) streamed content; response.content is used when omitted.
+        """
         technologies = []
 
         # From headers
@@ -161,46 +276,46 @@ class HTTPMonitor:
                 else:
                     technologies.append(value)
 
-        # From content
-        content = response.text.lower()
+        # From content: every marker is ASCII, so match on lowercased bytes and skip decoding
+        content = (response.content if body is None else body)[:_TECH_SCAN_BYTES].lower()
 
         # WordPress
-        if 'wp-content' in content or 'wp-includes' in content:
+        if b'wp-content' in content or b'wp-includes' in content:
             # Try to extract version
-            version_match = re.search(r'wordpress[/\s]+(\d+\.\d+(?:\.\d+)?)', content)
+            version_match = _WORDPRESS_VERSION_RE.search(content)
             if version_match:
-                technologies.append(f"WordPress {version_match.group(1)}")
+                technologies.append(f"WordPress {version_match.group(1).decode()}")
             else:
                 technologies.append("WordPress")
 
         # jQuery
-        jquery_match = re.search(r'jquery[/-]?(\d+\.\d+\.\d+)', content)
+        jquery_match = _JQUERY_VERSION_RE.search(content)
         if jquery_match:
-            technologies.append(f"jQuery {jquery_match.group(1)}")
+            technologies.append(f"jQuery {jquery_match.group(1).decode()}")
 
         # React
-        if 'react' in content and '__react' in content:
+        if b'react' in content and b'__react' in content:
             technologies.append("React")
 
         # Vue.js
-        if 'vue.js' in content or 'vuejs' in content:
+        if b'vue.js' in content or b'vuejs' in content:
             technologies.append("Vue.js")
 
         # Angular
-        if 'ng-app' in content or 'angular' in content:
+        if b'ng-app' in content or b'angular' in content:
             technologies.append("Angular")
 
         # Bootstrap
-        bootstrap_match = re.search(r'bootstrap[/-]?(\d+\.\d+\.\d+)', content)
+        bootstrap_match = _BOOTSTRAP_VERSION_RE.search(content)
         if bootstrap_match:
-            technologies.append(f"Bootstrap {bootstrap_match.group(1)}")
+            technologies.append(f"Bootstrap {bootstrap_match.group(1).decode()}")
 
         # Drupal
-        if 'drupal' in content:
+        if b'drupal' in content:
             technologies.append("Drupal")
 
         # Joomla
-        if 'joomla' in content:
+        if b'joomla' in content:
             technologies.append("Joomla")
 
         return list(set(technologies))
@@ -240,8 +355,9 @@ class HTTPMonitor:
 
         # Check for outdated/vulnerable technologies
         for tech in result.get('technologies', []):
-            for tech_name, vulnerable_versions in self.outdated_tech.items():
-                if tech_name.lower() in tech.lower():
+            tech_lower = tech.lower()
+            for tech_name, vulnerable_versions in _OUTDATED_TECH_LOWER:
+                if tech_name in tech_lower:
                     for vuln_version in vulnerable_versions:
                         if vuln_version in tech:
                             flags.append({
@@ -275,10 +391,11 @@ class HTTPMonitor:
             })
 
         # Redirects (potential open redirect)
-        if result.get('redirects'):
+        redirect_count = result.get('redirect_count', len(result.get('redirects', ())))
+        if redirect_count:
             flags.append({
                 'type': 'redirect',
-                'message': f"Redirects detected: {len(result['redirects'])} hop(s)",
+                'message': f"Redirects detected: {redirect_count} hop(s)",
                 'severity': 'low'
             })
 
@@ -335,10 +452,12 @@ class HTTPMonitor:
         # Body length change (significant = >10%)
         old_length = old.get('body_length', 0)
         new_length = new.get('body_length', 0)
+        length_changed = False
 
-        if old_length > 0:
+        if old_length > 0 and new_length != old_length:
             length_diff_percent = abs(new_length - old_length) / old_length * 100
             if length_diff_percent > 10:
+                length_changed = True
                 changes['has_changes'] = True
                 changes['changes'].append({
                     'type': 'body_length',
@@ -349,22 +468,25 @@ class HTTPMonitor:
                     'severity': 'medium' if length_diff_percent > 50 else 'low'
                 })
 
-        # Content hash change
-        if old.get('content_hash') != new.get('content_hash'):
-            if not any(c['type'] == 'body_length' for c in changes['changes']):
-                changes['has_changes'] = True
-                changes['changes'].append({
-                    'type': 'content',
-                    'message': 'Content changed (same size, different hash)',
-                    'severity': 'low'
-                })
-
-        # Technology changes
-        old_tech = set(old.get('technologies', []))
-        new_tech = set(new.get('technologies', []))
+        # Content hash change (only compared when no significant size change was reported)
+        if not length_changed and old.get('content_hash') != new.get('content_hash'):
+            changes['has_changes'] = True
+            changes['changes'].append({
+                'type': 'content',
+                'message': 'Content changed (same size, different hash)',
+                'severity': 'low'
+            })
 
-        added_tech = new_tech - old_tech
-        removed_tech = old_tech - new_tech
+        # Technology changes (sets are only built when the stored lists differ)
+        old_tech_list = old.get('technologies', [])
+        new_tech_list = new.get('technologies', [])
+        if old_tech_list == new_tech_list:
+            added_tech = removed_tech = ()
+        else:
+            old_tech = set(old_tech_list)
+            new_tech = set(new_tech_list)
+            added_tech = new_tech - old_tech
+            removed_tech = old_tech - new_tech
 
         if added_tech:
             changes['has_changes'] = True
@@ -386,8 +508,6 @@ class HTTPMonitor:
 
         # New flags
         old_flags = {f.get('message') for f in old.get('flags', [])}
-        new_flags = {f.get('message') for f in new.get('flags', [])}
-
         added_flags = [f for f in new.get('flags', []) if f.get('message') not in old_flags]
 
         if added_flags:
@@ -418,7 +538,7 @@ class HTTPMonitor:
 
         if parallel:
             import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor(max_workers=20) as executor:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
                 future_to_url = {executor.submit(self.probe_url, url): url for url in urls}
 
                 for future in concurrent.futures.as_completed(future_to_url):
@@ -438,8 +558,8 @@ class HTTPMonitor:
         """Save probe results to file"""
         snapshot_file = self.output_dir / filename
 
-        with open(snapshot_file, 'w') as f:
-            json.dump(results, f, indent=2)
+        with open(snapshot_file, 'wb') as f:
+            f.write(_dumps_indented(results))
 
         return snapshot_file
 
@@ -450,8 +570,8 @@ class HTTPMonitor:
         if not snapshot_file.exists():
             return None
 
-        with open(snapshot_file, 'r') as f:
-            return json.load(f)
+        with open(snapshot_file, 'rb') as f:
+            return _loads(f.read())
 
     def print_results(self, results: Dict[str, Dict[str, Any]]):
         """Print probe results in readable format"""
@@ -528,10 +648,11 @@ def main():
     parser.add_argument('-o', '--output', default='./http_data', help='Output directory')
     parser.add_argument('-s', '--snapshot', help='Save snapshot with this name')
     parser.add_argument('-c', '--compare', help='Compare with previous snapshot')
+    parser.add_argument('-w', '--workers', type=int, default=20, help='Parallel probe workers (default: 20)')
 
     args = parser.parse_args()
 
-    monitor = HTTPMonitor(args.output)
+    monitor = HTTPMonitor(args.output, max_workers=args.workers)
 
     # Collect URLs
     urls = []
@@ -5,23 +5,254 @@ Supports: Slack, Discord, Telegram, Email
 """
 
 import json
+import atexit
 import requests
+import threading
+import concurrent.futures
 import smtplib
+import logging
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from typing import Dict, Any, List
+from urllib3.util.retry import Retry
+
+
+logger = logging.getLogger(__name__)
+
+
+# Longest Retry-After a webhook send will wait out, so one throttled channel can't stall a dispatch
+_RETRY_AFTER_MAX = 10
+
+
+class _WebhookRetry(Retry):
+    """Retry policy that only resends a POST the webhook is known not to have accepted"""
+
+    # With status_forcelist=[429] this retries 503 only when the server sends Retry-After
+    RETRY_AFTER_STATUS_CODES = frozenset({429, 503})
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        return None if retry_after is None else min(retry_after, _RETRY_AFTER_MAX)
+
+
+def _create_session() -> requests.Session:
+    """Pooled keep-alive session with retries for rate-limited webhooks"""
+    session = requests.Session()
+    # Gateway errors (502/504) and read timeouts may come after the message was delivered,
+    # and resending them would post the alert twice
+    retry = _WebhookRetry(
+        total=2,
+        read=0,
+        backoff_factor=0.3,
+        status_forcelist=[429],
+        allowed_methods=frozenset({'POST'}),
+        raise_on_status=False
+    )
+    adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+# Static <head> of the baseline email, kept out of the per-call f-string
+_EMAIL_BASELINE_HEAD = """
+        <html>
+        <head>
+            <style>
+                body { font-family: Arial, sans-serif; }
+                .header { background-color: #4CAF50; color: white; padding: 15px; }
+                .section { margin: 20px 0; padding: 15px; background-color: #f9f9f9; border-left: 4px solid #4CAF50; }
+                .metric { display: inline-block; margin: 10px 20px 10px 0; }
+                .metric-value { font-size: 24px; font-weight: bold; color: #4CAF50; }
+                .metric-label { font-size: 14px; color: #666; }
+                .warning { color: #ff9800; }
+                .critical { color: #f44336; }
+                ul { list-style-type: none; padding-left: 0; }
+                li { padding: 5px 0; }
+            </style>
+        </head>
+        <body>"""
+
+# Shared by every Notifier: monitor.py creates one per alert, so connections to the
+# webhook hosts are only reused across alerts if the session outlives the instance
+_session = _create_session()
+
+# SMTP connections are reused across alerts the same way; keyed by (server, port, username)
+_smtp_connections = {}
+_smtp_lock = threading.Lock()
+
+
+@atexit.register
+def _close_smtp_connections():
+    for connection in _smtp_connections.values():
+        try:
+            connection.quit()
+        except (smtplib.SMTPException, OSError):
+            pass
+    _smtp_connections.clear()
+
+# Discord embed colours
+_DISCORD_RED = 15158332
+_DISCORD_ORANGE = 15105570
+_DISCORD_BLUE = 3447003
+_DISCORD_GREEN = 3066993
+
+# Change alert title indexed by is_critical, and the shared (never mutated) footer
+_DISCORD_CHANGE_TITLES = ("🔍 Monitoring Alert", "🚨 CRITICAL ALERT")
+_DISCORD_CHANGE_FOOTER = {"text": "BB-Monitor Change Detection"}
+
+# Status each webhook API answers a successful post with
+_SUCCESS_STATUS = {'slack': 200, 'discord': 204, 'telegram': 200}
+
+# Per-field and per-section text limits; longer values make the whole message fail
+_DISCORD_FIELD_LIMIT = 1024
+_SLACK_TEXT_LIMIT = 3000
+
+# Discord also caps a message at 25 fields per embed and 6000 characters of embed text overall
+_DISCORD_EMBED_FIELDS = 25
+_DISCORD_MESSAGE_LIMIT = 6000
+
+
+def _split_text(text: str, limit: int) -> List[str]:
+    """Split text on line boundaries into pieces of at most limit characters"""
+    if len(text) <= limit:
+        return [text]
+
+    pieces, current, size = [], [], -1
+    for line in text.split('\n'):
+        line = line[:limit]
+        if current and size + 1 + len(line) > limit:
+            pieces.append('\n'.join(current))
+            current, size = [], -1
+        current.append(line)
+        size += 1 + len(line)
+    pieces.append('\n'.join(current))
+
+    # Empty values are rejected as well
+    return [piece for piece in pieces if piece.strip()]
+
+
+def _discord_fields(name: str, value: str) -> List[Dict[str, Any]]:
+    """Embed field(s) for a list, continued in further fields past Discord's value limit"""
+    return [
+        {"name": name if i == 0 else f"{name} (cont.)", "value": piece, "inline": False}
+        for i, piece in enumerate(_split_text(value, _DISCORD_FIELD_LIMIT))
+    ]
+
+
+def _discord_messages(embed: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Webhook payload(s) for an embed, moving fields past Discord's message limits into follow-ups"""
+    fields = embed.get('fields', [])
+    current = {**embed, 'fields': []}
+    messages = [{"embeds": [current]}]
+    size = (len(embed.get('title', '')) + len(embed.get('description', ''))
+            + len(embed.get('footer', {}).get('text', '')))
+
+    for field in fields:
+        field_size = len(field['name']) + len(field['value'])
+        if len(current['fields']) == _DISCORD_EMBED_FIELDS or size + field_size > _DISCORD_MESSAGE_LIMIT:
+            current = {"title": f"{embed['title']} (cont.)", "color": embed.get('color'), "fields": []}
+            messages.append({"embeds": [current]})
+            size = len(current['title'])
+        current['fields'].append(field)
+        size += field_size
+
+    return messages
+
+
+def _slack_sections(text: str) -> List[Dict[str, Any]]:
+    """Section block(s) for mrkdwn text, continued in further sections past Slack's limit"""
+    return [
+        {"type": "section", "text": {"type": "mrkdwn", "text": piece}}
+        for piece in _split_text(text, _SLACK_TEXT_LIMIT)
+    ]
+
+_CHANNELS = ('slack', 'discord', 'telegram', 'email')
+
+# notify_on entries that subscribe a channel to change notifications, as mask bits.
+# 'all' is a bit every change event carries, so it matches whatever changed
+_CHANGE_EVENT_BITS = {
+    'all': 1,
+    'subdomain_takeover': 2,
+    'new_subdomain': 4,
+    'new_endpoint': 8,
+    'changed_endpoint': 16
+}
 
 class Notifier:
     def __init__(self, config: Dict[str, Any]):
         self.config = config
+        # Channel settings are fixed for a Notifier's lifetime, so resolve them once
+        self._enabled = {chan: bool(config.get(chan, {}).get('enabled')) for chan in _CHANNELS}
+        self._notify_on = {chan: frozenset(config.get(chan, {}).get('notify_on', ())) for chan in _CHANNELS}
+        self._change_masks = {
+            chan: sum(bit for event, bit in _CHANGE_EVENT_BITS.items() if event in self._notify_on[chan])
+            if self._enabled[chan] else 0
+            for chan in _CHANNELS
+        }
+
+    def _dispatch(self, sends: List[tuple]):
+        """Run (send_fn, args) pairs, concurrently when more than one channel is notified"""
+        if len(sends) <= 1:
+            for send, args in sends:
+                send(*args)
+            return
+
+        # Sends are network-bound, so channels go out in parallel and total time is the slowest one
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(sends), thread_name_prefix='notifier') as pool:
+            futures = [pool.submit(send, *args) for send, args in sends]
+        for future in futures:
+            future.result()
 
     def should_notify(self, change_type: str, notification_config: Dict) -> bool:
         """Check if this change type should trigger notification"""
         return change_type in notification_config.get('notify_on', [])
 
+    def _post(self, channel: str, url: str, payload: Dict[str, Any], what: str, sent: str):
+        """POST a JSON payload to a channel's API and report the outcome"""
+        try:
+            response = _session.post(url, json=payload, timeout=10)
+            if response.status_code == _SUCCESS_STATUS[channel]:
+                logger.info(sent)
+            else:
+                logger.warning("%s failed: %s", what, response.status_code)
+        except Exception as e:
+            logger.exception("%s error: %s", what, e)
+
+    def _send_smtp(self, msg: MIMEMultipart):
+        """Send an email over a cached SMTP connection, logging in only when it was dropped"""
+        email_config = self.config['email']
+        key = (email_config['smtp_server'], email_config['smtp_port'], email_config['username'])
+
+        with _smtp_lock:
+            server = _smtp_connections.pop(key, None)
+            if server is not None:
+                # Servers close idle sessions between alerts, so check it is still alive
+                try:
+                    if server.noop()[0] != 250:
+                        server.close()
+                        server = None
+                except (smtplib.SMTPException, OSError):
+                    server.close()
+                    server = None
+
+            try:
+                if server is None:
+                    server = smtplib.SMTP(email_config['smtp_server'], email_config['smtp_port'], timeout=30)
+                    server.starttls()
+                    server.login(email_config['username'], email_config['password'])
+                server.send_message(msg)
+            except Exception:
+                if server is not None:
+                    server.close()
+                raise
+
+            # Only cached once a send has gone through on it
+            _smtp_connections[key] = server
+
     def send_slack(self, message: str, changes: Dict[str, Any]):
         """Send notification to Slack"""
-        if not self.config['slack']['enabled']:
+        if not self._enabled['slack']:
             return
 
         webhook_url = self.config['slack']['webhook_url']
@@ -71,18 +302,11 @@ class Notifier:
             "blocks": blocks
         }
 
-        try:
-            response = requests.post(webhook_url, json=payload, timeout=10)
-            if response.status_code == 200:
-                print("[+] Slack notification sent")
-            else:
-                print(f"[!] Slack notification failed: {response.status_code}")
-        except Exception as e:
-            print(f"[!] Slack notification error: {e}")
+        self._post('slack', webhook_url, payload, "Slack notification", "Slack notification sent")
 
     def send_discord(self, message: str, changes: Dict[str, Any]):
         """Send notification to Discord"""
-        if not self.config['discord']['enabled']:
+        if not self._enabled['discord']:
             return
 
         webhook_url = self.config['discord']['webhook_url']
@@ -91,7 +315,7 @@ class Notifier:
         embed = {
             "title": "🔍 Bug Bounty Changes Detected",
             "description": message,
-            "color": 3447003,  # Blue
+            "color": _DISCORD_BLUE,
             "fields": []
         }
 
@@ -120,90 +344,69 @@ class Notifier:
             "embeds": [embed]
         }
 
-        try:
-            response = requests.post(webhook_url, json=payload, timeout=10)
-            if response.status_code == 204:
-                print("[+] Discord notification sent")
-            else:
-                print(f"[!] Discord notification failed: {response.status_code}")
-        except Exception as e:
-            print(f"[!] Discord notification error: {e}")
+        self._post('discord', webhook_url, payload, "Discord notification", "Discord notification sent")
 
     def send_telegram(self, message: str, changes: Dict[str, Any]):
         """Send notification to Telegram"""
-        if not self.config['telegram']['enabled']:
+        if not self._enabled['telegram']:
             return
 
         bot_token = self.config['telegram']['bot_token']
         chat_id = self.config['telegram']['chat_id']
 
         # Build formatted message
-        text = f"🔍 *Bug Bounty Changes Detected*\n\n{message}\n\n"
+        text = [f"🔍 *Bug Bounty Changes Detected*\n\n{message}\n\n"]
 
         if changes.get('new_subdomains'):
-            text += f"*New Subdomains:* {len(changes['new_subdomains'])}\n"
+            text.append(f"*New Subdomains:* {len(changes['new_subdomains'])}\n")
             # Show first 5
-            for sub in changes['new_subdomains'][:5]:
-                text += f"  • {sub}\n"
+            text.extend(f"  • {sub}\n" for sub in changes['new_subdomains'][:5])
             if len(changes['new_subdomains']) > 5:
-                text += f"  ... and {len(changes['new_subdomains']) - 5} more\n"
+                text.append(f"  ... and {len(changes['new_subdomains']) - 5} more\n")
 
         if changes.get('new_endpoints'):
-            text += f"\n*New Endpoints:* {len(changes['new_endpoints'])}\n"
-            for ep in changes['new_endpoints'][:5]:
-                text += f"  • {ep}\n"
+            text.append(f"\n*New Endpoints:* {len(changes['new_endpoints'])}\n")
+            text.extend(f"  • {ep}\n" for ep in changes['new_endpoints'][:5])
             if len(changes['new_endpoints']) > 5:
-                text += f"  ... and {len(changes['new_endpoints']) - 5} more\n"
+                text.append(f"  ... and {len(changes['new_endpoints']) - 5} more\n")
 
         url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
         payload = {
             "chat_id": chat_id,
-            "text": text,
+            "text": ''.join(text),
             "parse_mode": "Markdown"
         }
 
-        try:
-            response = requests.post(url, json=payload, timeout=10)
-            if response.status_code == 200:
-                print("[+] Telegram notification sent")
-            else:
-                print(f"[!] Telegram notification failed: {response.status_code}")
-        except Exception as e:
-            print(f"[!] Telegram notification error: {e}")
+        self._post('telegram', url, payload, "Telegram notification", "Telegram notification sent")
 
     def send_email(self, subject: str, message: str, changes: Dict[str, Any]):
         """Send email notification"""
-        if not self.config['email']['enabled']:
+        if not self._enabled['email']:
             return
 
-        smtp_server = self.config['email']['smtp_server']
-        smtp_port = self.config['email']['smtp_port']
         username = self.config['email']['username']
-        password = self.config['email']['password']
         to_email = self.config['email']['to_email']
 
-        # Create HTML email
-        html = f"""
+        # Create HTML email; every change is listed, so collect parts and join once
+        html = [f"""
         <html>
         <body>
             <h2>🔍 Bug Bounty Changes Detected</h2>
             <p>{message}</p>
             <hr>
-        """
+        """]
 
         if changes.get('new_subdomains'):
-            html += f"<h3>New Subdomains ({len(changes['new_subdomains'])})</h3><ul>"
-            for sub in changes['new_subdomains']:
-                html += f"<li>{sub}</li>"
-            html += "</ul>"
+            html.append(f"<h3>New Subdomains ({len(changes['new_subdomains'])})</h3><ul>")
+            html.extend(f"<li>{sub}</li>" for sub in changes['new_subdomains'])
+            html.append("</ul>")
 
         if changes.get('new_endpoints'):
-            html += f"<h3>New Endpoints ({len(changes['new_endpoints'])})</h3><ul>"
-            for ep in changes['new_endpoints']:
-                html += f"<li>{ep}</li>"
-            html += "</ul>"
+            html.append(f"<h3>New Endpoints ({len(changes['new_endpoints'])})</h3><ul>")
+            html.extend(f"<li>{ep}</li>" for ep in changes['new_endpoints'])
+            html.append("</ul>")
 
-        html += "</body></html>"
+        html.append("</body></html>")
 
         # Create message
         msg = MIMEMultipart('alternative')
@@ -211,49 +414,59 @@ class Notifier:
         msg['From'] = username
         msg['To'] = to_email
 
-        html_part = MIMEText(html, 'html')
+        html_part = MIMEText(''.join(html), 'html')
         msg.attach(html_part)
 
         try:
-            server = smtplib.SMTP(smtp_server, smtp_port)
-            server.starttls()
-            server.login(username, password)
-            server.send_message(msg)
-            server.quit()
-            print("[+] Email notification sent")
+            self._send_smtp(msg)
+            logger.info("Email notification sent")
         except Exception as e:
-            print(f"[!] Email notification error: {e}")
+            logger.exception("Email notification error: %s", e)
 
     def send_baseline_alert(self, domain: str, baseline: Dict[str, Any]):
         """Send notification for completed baseline scan with crucial data"""
+        senders = [
+            send for chan, send in (
+                ('slack', self._send_slack_baseline),
+                ('discord', self._send_discord_baseline),
+                ('telegram', self._send_telegram_baseline),
+                ('email', self._send_email_baseline)
+            )
+            if self._enabled[chan] and 'baseline_complete' in self._notify_on[chan]
+        ]
+
+        # Nothing subscribes to baseline_complete, so skip building the summary
+        if not senders:
+            return
 
-        # Extract key metrics
+        # Extract key metrics in a single pass over the endpoints
+        endpoints = baseline.get('endpoints', {})
         total_subdomains = len(baseline.get('subdomains', {}))
-        total_endpoints = len(baseline.get('endpoints', {}))
-        live_endpoints = sum(1 for url, data in baseline.get('endpoints', {}).items()
-                            if data.get('status_code'))
-
-        # Count HTTP status categories
-        status_2xx = sum(1 for data in baseline.get('endpoints', {}).values()
-                        if 200 <= data.get('status_code', 0) < 300)
-        status_3xx = sum(1 for data in baseline.get('endpoints', {}).values()
-                        if 300 <= data.get('status_code', 0) < 400)
-        status_4xx = sum(1 for data in baseline.get('endpoints', {}).values()
-                        if 400 <= data.get('status_code', 0) < 500)
-        status_5xx = sum(1 for data in baseline.get('endpoints', {}).values()
-                        if 500 <= data.get('status_code', 0) < 600)
+        total_endpoints = len(endpoints)
+        live_endpoints = 0
+        status_classes = [0] * 6  # Indexed by status_code // 100
+        high_value_urls = []  # High-value targets (from flags)
+
+        for url, data in endpoints.items():
+            status_code = data.get('status_code') or 0
+            if status_code:
+                live_endpoints += 1
+                # Count HTTP status categories
+                status_class = status_code // 100
+                if 0 < status_class < 6:
+                    status_classes[status_class] += 1
+
+            for flag in data.get('flags', ()):
+                flag = str(flag).lower()
+                if 'high-value' in flag or 'admin' in flag or 'upload' in flag:
+                    high_value_urls.append(url)
+                    break
+
+        status_2xx, status_3xx, status_4xx, status_5xx = status_classes[2:]
 
         # Subdomain takeovers
         takeovers = baseline.get('subdomain_takeovers', [])
 
-        # High-value targets (from flags)
-        high_value_urls = []
-        for url, data in baseline.get('endpoints', {}).items():
-            flags = data.get('flags', [])
-            if any('high-value' in str(flag).lower() or 'admin' in str(flag).lower()
-                   or 'upload' in str(flag).lower() for flag in flags):
-                high_value_urls.append(url)
-
         # Shodan data
         shodan_data = baseline.get('shodan_data', {})
         shodan_summary = shodan_data.get('summary', {})
@@ -300,21 +513,7 @@ class Notifier:
         }
 
         # Send to configured channels
-        if self.config.get('slack', {}).get('enabled'):
-            if 'baseline_complete' in self.config['slack'].get('notify_on', []):
-                self._send_slack_baseline(summary)
-
-        if self.config.get('discord', {}).get('enabled'):
-            if 'baseline_complete' in self.config['discord'].get('notify_on', []):
-                self._send_discord_baseline(summary)
-
-        if self.config.get('telegram', {}).get('enabled'):
-            if 'baseline_complete' in self.config['telegram'].get('notify_on', []):
-                self._send_telegram_baseline(summary)
-
-        if self.config.get('email', {}).get('enabled'):
-            if 'baseline_complete' in self.config['email'].get('notify_on', []):
-                self._send_email_baseline(summary)
+        self._dispatch([(send, (summary,)) for send in senders])
 
     def _send_slack_baseline(self, summary: Dict[str, Any]):
         """Send baseline summary to Slack"""
@@ -352,19 +551,20 @@ class Notifier:
         # Security findings
         if summary['security']['subdomain_takeovers'] > 0 or summary['security']['high_value_targets'] > 0:
             blocks.append({"type": "divider"})
-            security_text = "*🔒 Security Findings:*\n"
+            security_text = ["*🔒 Security Findings:*\n"]
 
             if summary['security']['subdomain_takeovers'] > 0:
-                security_text += f"• ⚠️ Subdomain Takeovers: {summary['security']['subdomain_takeovers']}\n"
-                for takeover in summary['security']['takeover_list']:
-                    security_text += f"  - {takeover.get('subdomain', 'N/A')} ({takeover.get('service', 'unknown')})\n"
+                security_text.append(f"• ⚠️ Subdomain Takeovers: {summary['security']['subdomain_takeovers']}\n")
+                security_text.extend(
+                    f"  - {takeover.get('subdomain', 'N/A')} ({takeover.get('service', 'unknown')})\n"
+                    for takeover in summary['security']['takeover_list']
+                )
 
             if summary['security']['high_value_targets'] > 0:
-                security_text += f"• 🎯 High-Value Targets: {summary['security']['high_value_targets']}\n"
-                for url in summary['security']['high_value_list'][:5]:
-                    security_text += f"  - {url}\n"
+                security_text.append(f"• 🎯 High-Value Targets: {summary['security']['high_value_targets']}\n")
+                security_text.extend(f"  - {url}\n" for url in summary['security']['high_value_list'][:5])
 
-            blocks.append({"type": "section", "text": {"type": "mrkdwn", "text": security_text}})
+            blocks.extend(_slack_sections(''.join(security_text)))
 
         # Shodan findings
         if summary['shodan']['enabled']:
@@ -375,21 +575,23 @@ class Notifier:
         # Wayback findings
         if summary['wayback']['enabled'] and summary['wayback']['total_urls'] > 0:
             blocks.append({"type": "divider"})
-            wayback_text = f"*📜 Wayback Machine:*\n• Total URLs: {summary['wayback']['total_urls']}\n• Critical: {summary['wayback']['critical_urls']}\n• High Priority: {summary['wayback']['high_priority_urls']}"
+            wayback_text = [f"*📜 Wayback Machine:*\n• Total URLs: {summary['wayback']['total_urls']}\n• Critical: {summary['wayback']['critical_urls']}\n• High Priority: {summary['wayback']['high_priority_urls']}"]
 
             if summary['wayback']['categories']:
-                wayback_text += "\n• Categories:"
-                for cat, count in list(summary['wayback']['categories'].items())[:5]:
-                    wayback_text += f"\n  - {cat}: {count}"
+                wayback_text.append("\n• Categories:")
+                wayback_text.extend(
+                    f"\n  - {cat}: {count}"
+                    for cat, count in list(summary['wayback']['categories'].items())[:5]
+                )
 
-            blocks.append({"type": "section", "text": {"type": "mrkdwn", "text": wayback_text}})
+            blocks.append({"type": "section", "text": {"type": "mrkdwn", "text": ''.join(wayback_text)}})
 
         # Subdomain list (first 20)
         if summary['subdomains']['list']:
             blocks.append({"type": "divider"})
             sub_text = f"*Discovered Subdomains (showing {min(20, len(summary['subdomains']['list']))}/{summary['subdomains']['total']}):*\n"
             sub_text += "\n".join([f"• {sub}" for sub in summary['subdomains']['list'][:20]])
-            blocks.append({"type": "section", "text": {"type": "mrkdwn", "text": sub_text}})
+            blocks.extend(_slack_sections(sub_text))
 
         blocks.append({
             "type": "context",
@@ -398,14 +600,7 @@ class Notifier:
 
         payload = {"blocks": blocks}
 
-        try:
-            response = requests.post(webhook_url, json=payload, timeout=10)
-            if response.status_code == 200:
-                print("[+] Baseline alert sent to Slack")
-            else:
-                print(f"[!] Slack baseline alert failed: {response.status_code}")
-        except Exception as e:
-            print(f"[!] Slack baseline alert error: {e}")
+        self._post('slack', webhook_url, payload, "Slack baseline alert", "Baseline alert sent to Slack")
 
     def _send_discord_baseline(self, summary: Dict[str, Any]):
         """Send baseline summary to Discord"""
@@ -463,112 +658,76 @@ class Notifier:
             sub_list = "\n".join([f"• {sub}" for sub in summary['subdomains']['list'][:15]])
             if len(summary['subdomains']['list']) > 15:
                 sub_list += f"\n... and {len(summary['subdomains']['list']) - 15} more"
-            fields.append({
-                "name": f"Discovered Subdomains ({summary['subdomains']['total']})",
-                "value": sub_list,
-                "inline": False
-            })
+            fields.extend(_discord_fields(
+                f"Discovered Subdomains ({summary['subdomains']['total']})",
+                sub_list
+            ))
 
         embed = {
             "title": f"📊 Baseline Scan Complete",
             "description": description,
-            "color": 3066993,  # Green
+            "color": _DISCORD_GREEN,
             "fields": fields,
             "footer": {"text": f"Completed: {summary['timestamp']}"}
         }
 
-        payload = {"embeds": [embed]}
-
-        try:
-            response = requests.post(webhook_url, json=payload, timeout=10)
-            if response.status_code == 204:
-                print("[+] Baseline alert sent to Discord")
-            else:
-                print(f"[!] Discord baseline alert failed: {response.status_code}")
-        except Exception as e:
-            print(f"[!] Discord baseline alert error: {e}")
+        for payload in _discord_messages(embed):
+            self._post('discord', webhook_url, payload, "Discord baseline alert", "Baseline alert sent to Discord")
 
     def _send_telegram_baseline(self, summary: Dict[str, Any]):
         """Send baseline summary to Telegram"""
         bot_token = self.config['telegram']['bot_token']
         chat_id = self.config['telegram']['chat_id']
 
-        text = f"📊 *Baseline Scan Complete*\n\n"
-        text += f"*Domain:* {summary['domain']}\n\n"
+        text = [f"📊 *Baseline Scan Complete*\n\n"]
+        text.append(f"*Domain:* {summary['domain']}\n\n")
 
-        text += f"🌐 *Subdomains:* {summary['subdomains']['total']}\n"
-        text += f"🔗 *Endpoints:* {summary['endpoints']['total']} ({summary['endpoints']['live']} live)\n\n"
+        text.append(f"🌐 *Subdomains:* {summary['subdomains']['total']}\n")
+        text.append(f"🔗 *Endpoints:* {summary['endpoints']['total']} ({summary['endpoints']['live']} live)\n\n")
 
-        text += "*HTTP Status:*\n"
-        text += f"  ✅ 2xx: {summary['endpoints']['status_2xx']}\n"
-        text += f"  ↩️ 3xx: {summary['endpoints']['status_3xx']}\n"
-        text += f"  ❌ 4xx: {summary['endpoints']['status_4xx']}\n"
-        text += f"  🔴 5xx: {summary['endpoints']['status_5xx']}\n\n"
+        text.append("*HTTP Status:*\n")
+        text.append(f"  ✅ 2xx: {summary['endpoints']['status_2xx']}\n")
+        text.append(f"  ↩️ 3xx: {summary['endpoints']['status_3xx']}\n")
+        text.append(f"  ❌ 4xx: {summary['endpoints']['status_4xx']}\n")
+        text.append(f"  🔴 5xx: {summary['endpoints']['status_5xx']}\n\n")
 
         if summary['security']['subdomain_takeovers'] > 0:
-            text += f"⚠️ *Subdomain Takeovers:* {summary['security']['subdomain_takeovers']}\n"
+            text.append(f"⚠️ *Subdomain Takeovers:* {summary['security']['subdomain_takeovers']}\n")
 
         if summary['security']['high_value_targets'] > 0:
-            text += f"🎯 *High-Value Targets:* {summary['security']['high_value_targets']}\n"
+            text.append(f"🎯 *High-Value Targets:* {summary['security']['high_value_targets']}\n")
 
         if summary['shodan']['enabled']:
-            text += f"\n🛰️ *Shodan:*\n"
-            text += f"  Hosts: {summary['shodan']['hosts_scanned']}\n"
-            text += f"  With Vulns: {summary['shodan']['with_vulnerabilities']}\n"
+            text.append(f"\n🛰️ *Shodan:*\n")
+            text.append(f"  Hosts: {summary['shodan']['hosts_scanned']}\n")
+            text.append(f"  With Vulns: {summary['shodan']['with_vulnerabilities']}\n")
 
         if summary['wayback']['enabled'] and summary['wayback']['total_urls'] > 0:
-            text += f"\n📜 *Wayback:*\n"
-            text += f"  URLs: {summary['wayback']['total_urls']}\n"
-            text += f"  Critical: {summary['wayback']['critical_urls']}\n"
+            text.append(f"\n📜 *Wayback:*\n")
+            text.append(f"  URLs: {summary['wayback']['total_urls']}\n")
+            text.append(f"  Critical: {summary['wayback']['critical_urls']}\n")
 
         if summary['subdomains']['list']:
-            text += f"\n*Subdomains (showing 10/{summary['subdomains']['total']}):*\n"
-            for sub in summary['subdomains']['list'][:10]:
-                text += f"  • {sub}\n"
+            text.append(f"\n*Subdomains (showing 10/{summary['subdomains']['total']}):*\n")
+            text.extend(f"  • {sub}\n" for sub in summary['subdomains']['list'][:10])
 
-        text += f"\n_Completed: {summary['timestamp']}_"
+        text.append(f"\n_Completed: {summary['timestamp']}_")
 
         url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
         payload = {
             "chat_id": chat_id,
-            "text": text,
+            "text": ''.join(text),
             "parse_mode": "Markdown"
         }
 
-        try:
-            response = requests.post(url, json=payload, timeout=10)
-            if response.status_code == 200:
-                print("[+] Baseline alert sent to Telegram")
-            else:
-                print(f"[!] Telegram baseline alert failed: {response.status_code}")
-        except Exception as e:
-            print(f"[!] Telegram baseline alert error: {e}")
+        self._post('telegram', url, payload, "Telegram baseline alert", "Baseline alert sent to Telegram")
 
     def _send_email_baseline(self, summary: Dict[str, Any]):
         """Send baseline summary via Email"""
-        smtp_server = self.config['email']['smtp_server']
-        smtp_port = self.config['email']['smtp_port']
         username = self.config['email']['username']
-        password = self.config['email']['password']
         to_email = self.config['email']['to_email']
 
-        html = f"""
-        <html>
-        <head>
-            <style>
-                body {{ font-family: Arial, sans-serif; }}
-                .header {{ background-color: #4CAF50; color: white; padding: 15px; }}
-                .section {{ margin: 20px 0; padding: 15px; background-color: #f9f9f9; border-left: 4px solid #4CAF50; }}
-                .metric {{ display: inline-block; margin: 10px 20px 10px 0; }}
-                .metric-value {{ font-size: 24px; font-weight: bold; color: #4CAF50; }}
-                .metric-label {{ font-size: 14px; color: #666; }}
-                .warning {{ color: #ff9800; }}
-                .critical {{ color: #f44336; }}
-                ul {{ list-style-type: none; padding-left: 0; }}
-                li {{ padding: 5px 0; }}
-            </style>
-        </head>
-        <body>
+        html = [_EMAIL_BASELINE_HEAD, f"""
             <div class="header">
                 <h1>📊 Baseline Scan Complete</h1>
                 <p>Domain: {summary['domain']}</p>
@@ -599,18 +758,18 @@ class Notifier:
                     <li class="warning">🔴 5xx (Server Error): {summary['endpoints']['status_5xx']}</li>
                 </ul>
             </div>
-        """
+        """]
 
         if summary['security']['subdomain_takeovers'] > 0 or summary['security']['high_value_targets'] > 0:
-            html += '<div class="section"><h2 class="critical">🔒 Security Findings</h2><ul>'
+            html.append('<div class="section"><h2 class="critical">🔒 Security Findings</h2><ul>')
             if summary['security']['subdomain_takeovers'] > 0:
-                html += f'<li class="critical">⚠️ Subdomain Takeovers: {summary["security"]["subdomain_takeovers"]}</li>'
+                html.append(f'<li class="critical">⚠️ Subdomain Takeovers: {summary["security"]["subdomain_takeovers"]}</li>')
             if summary['security']['high_value_targets'] > 0:
-                html += f'<li class="warning">🎯 High-Value Targets: {summary["security"]["high_value_targets"]}</li>'
-            html += '</ul></div>'
+                html.append(f'<li class="warning">🎯 High-Value Targets: {summary["security"]["high_value_targets"]}</li>')
+            html.append('</ul></div>')
 
         if summary['shodan']['enabled']:
-            html += f'''
+            html.append(f'''
             <div class="section">
                 <h2>🛰️ Shodan Results</h2>
                 <ul>
@@ -619,10 +778,10 @@ class Notifier:
                     <li>High-Value Hosts: {summary['shodan']['high_value_hosts']}</li>
                 </ul>
             </div>
-            '''
+            ''')
 
         if summary['wayback']['enabled'] and summary['wayback']['total_urls'] > 0:
-            html += f'''
+            html.append(f'''
             <div class="section">
                 <h2>📜 Wayback Machine</h2>
                 <ul>
@@ -631,38 +790,33 @@ class Notifier:
                     <li>High Priority: {summary['wayback']['high_priority_urls']}</li>
                 </ul>
             </div>
-            '''
+            ''')
 
         if summary['subdomains']['list']:
-            html += f'''
+            html.append(f'''
             <div class="section">
                 <h2>Discovered Subdomains (showing 20/{summary['subdomains']['total']})</h2>
                 <ul>
-            '''
-            for sub in summary['subdomains']['list'][:20]:
-                html += f'<li>• {sub}</li>'
-            html += '</ul></div>'
+            ''')
+            html.extend(f'<li>• {sub}</li>' for sub in summary['subdomains']['list'][:20])
+            html.append('</ul></div>')
 
-        html += f'<p style="color: #666; font-size: 12px;">Scan completed: {summary["timestamp"]}</p>'
-        html += '</body></html>'
+        html.append(f'<p style="color: #666; font-size: 12px;">Scan completed: {summary["timestamp"]}</p>')
+        html.append('</body></html>')
 
         msg = MIMEMultipart('alternative')
         msg['Subject'] = f"Baseline Scan Complete: {summary['domain']}"
         msg['From'] = username
         msg['To'] = to_email
 
-        html_part = MIMEText(html, 'html')
+        html_part = MIMEText(''.join(html), 'html')
         msg.attach(html_part)
 
         try:
-            server = smtplib.SMTP(smtp_server, smtp_port)
-            server.starttls()
-            server.login(username, password)
-            server.send_message(msg)
-            server.quit()
-            print("[+] Baseline alert sent via Email")
+            self._send_smtp(msg)
+            logger.info("Baseline alert sent via Email")
         except Exception as e:
-            print(f"[!] Email baseline alert error: {e}")
+            logger.exception("Email baseline alert error: %s", e)
 
     def notify_changes(self, domain: str, changes: Dict[str, Any]):
         """Send notifications for detected changes"""
@@ -677,7 +831,7 @@ class Notifier:
             changes.get('new_takeovers'),
             changes.get('resolved_takeovers')
         ]):
-            print(f"[*] No changes to notify for {domain}")
+            logger.info("No changes to notify for %s", domain)
             return
 
         message = f"Changes detected for domain: *{domain}*"
@@ -709,214 +863,168 @@ class Notifier:
                             critical_priority = True
                             high_priority = True
 
-        print(f"[*] Sending change notifications for {domain} (Priority: {'CRITICAL' if critical_priority else 'HIGH' if high_priority else 'NORMAL'})")
+        logger.info("Sending change notifications for %s (Priority: %s)",
+                    domain, 'CRITICAL' if critical_priority else 'HIGH' if high_priority else 'NORMAL')
 
         # Send notifications based on configuration
-        if self.config.get('slack', {}).get('enabled'):
-            notify_on = self.config['slack'].get('notify_on', [])
-            should_notify = False
-
-            if 'all' in notify_on:
-                should_notify = True
-            elif critical_priority and 'subdomain_takeover' in notify_on:
-                should_notify = True
-            elif changes.get('new_subdomains') and 'new_subdomain' in notify_on:
-                should_notify = True
-            elif changes.get('new_endpoints') and 'new_endpoint' in notify_on:
-                should_notify = True
-            elif changes.get('changed_endpoints') and 'changed_endpoint' in notify_on:
-                should_notify = True
-
-            if should_notify:
-                self.send_slack(message, changes)
-
-        if self.config.get('discord', {}).get('enabled'):
-            notify_on = self.config['discord'].get('notify_on', [])
-            should_notify = False
-
-            if 'all' in notify_on:
-                should_notify = True
-            elif critical_priority and 'subdomain_takeover' in notify_on:
-                should_notify = True
-            elif changes.get('new_subdomains') and 'new_subdomain' in notify_on:
-                should_notify = True
-            elif changes.get('new_endpoints') and 'new_endpoint' in notify_on:
-                should_notify = True
-            elif changes.get('changed_endpoints') and 'changed_endpoint' in notify_on:
-                should_notify = True
-
-            if should_notify:
-                self._send_discord_changes(domain, changes, critical_priority)
-
-        if self.config.get('telegram', {}).get('enabled'):
-            notify_on = self.config['telegram'].get('notify_on', [])
-            should_notify = False
-
-            if 'all' in notify_on:
-                should_notify = True
-            elif critical_priority and 'subdomain_takeover' in notify_on:
-                should_notify = True
-            elif changes.get('new_subdomains') and 'new_subdomain' in notify_on:
-                should_notify = True
-            elif changes.get('new_endpoints') and 'new_endpoint' in notify_on:
-                should_notify = True
-            elif changes.get('changed_endpoints') and 'changed_endpoint' in notify_on:
-                should_notify = True
-
-            if should_notify:
-                self.send_telegram(message, changes)
-
-        if self.config.get('email', {}).get('enabled'):
+        event_mask = (
+            _CHANGE_EVENT_BITS['all']
+            | (_CHANGE_EVENT_BITS['subdomain_takeover'] if critical_priority else 0)
+            | (_CHANGE_EVENT_BITS['new_subdomain'] if changes.get('new_subdomains') else 0)
+            | (_CHANGE_EVENT_BITS['new_endpoint'] if changes.get('new_endpoints') else 0)
+            | (_CHANGE_EVENT_BITS['changed_endpoint'] if changes.get('changed_endpoints') else 0)
+        )
+
+        sends = [
+            (send, args) for chan, send, args in (
+                ('slack', self.send_slack, (message, changes)),
+                ('discord', self._send_discord_changes, (domain, changes, critical_priority)),
+                ('telegram', self.send_telegram, (message, changes))
+            )
+            if self._change_masks[chan] & event_mask
+        ]
+
+        if self._enabled['email']:
             if critical_priority or high_priority:
-                self.send_email(
-                    f"Bug Bounty Changes: {domain}",
-                    message,
-                    changes
-                )
+                sends.append((self.send_email, (f"Bug Bounty Changes: {domain}", message, changes)))
+
+        self._dispatch(sends)
 
     def _send_discord_changes(self, domain: str, changes: Dict[str, Any], is_critical: bool = False):
         """Send detailed change notification to Discord"""
         webhook_url = self.config['discord']['webhook_url']
 
+        # Look up each change list and its size once
+        new_subdomains = changes.get('new_subdomains') or ()
+        new_endpoints = changes.get('new_endpoints') or ()
+        changed_endpoints = changes.get('changed_endpoints') or ()
+        new_js_endpoints = changes.get('new_js_endpoints') or ()
+        new_takeovers = changes.get('new_takeovers') or ()
+        n_subdomains, n_endpoints, n_changed, n_js, n_takeovers = map(
+            len, (new_subdomains, new_endpoints, changed_endpoints, new_js_endpoints, new_takeovers)
+        )
+
         # Build description
         description = f"**Monitoring changes detected for {domain}**\n\n"
 
         # Count changes
-        total_changes = (
-            len(changes.get('new_subdomains', [])) +
-            len(changes.get('new_endpoints', [])) +
-            len(changes.get('changed_endpoints', [])) +
-            len(changes.get('new_js_endpoints', [])) +
-            len(changes.get('new_takeovers', []))
-        )
+        total_changes = n_subdomains + n_endpoints + n_changed + n_js + n_takeovers
 
         description += f"**Total Changes:** {total_changes}\n"
 
         # Determine color
         if is_critical:
-            color = 15158332  # Red
-        elif changes.get('new_subdomains') or changes.get('new_endpoints'):
-            color = 15105570  # Orange
+            color = _DISCORD_RED
+        elif n_subdomains or n_endpoints:
+            color = _DISCORD_ORANGE
         else:
-            color = 3447003   # Blue
+            color = _DISCORD_BLUE
 
         fields = []
 
         # New subdomains
-        if changes.get('new_subdomains'):
-            subdomain_list = "\n".join([f"• {sub}" for sub in changes['new_subdomains'][:10]])
-            if len(changes['new_subdomains']) > 10:
-                subdomain_list += f"\n... and {len(changes['new_subdomains']) - 10} more"
+        if n_subdomains:
+            subdomain_list = "\n".join([f"• {sub}" for sub in new_subdomains[:10]])
+            if n_subdomains > 10:
+                subdomain_list += f"\n... and {n_subdomains - 10} more"
 
-            fields.append({
-                "name": f"🆕 New Subdomains ({len(changes['new_subdomains'])})",
-                "value": subdomain_list,
-                "inline": False
-            })
+            fields.extend(_discord_fields(
+                f"🆕 New Subdomains ({n_subdomains})",
+                subdomain_list
+            ))
 
         # Subdomain takeovers (CRITICAL)
-        if changes.get('new_takeovers'):
-            takeover_list = ""
-            for takeover in changes['new_takeovers'][:5]:
-                takeover_list += f"• **{takeover.get('subdomain', 'N/A')}**\n"
-                takeover_list += f"  Service: {takeover.get('service', 'unknown')}\n"
-                takeover_list += f"  CNAME: {takeover.get('cname', 'N/A')}\n"
-                takeover_list += f"  Confidence: {takeover.get('confidence', 'N/A')}\n"
-
-            fields.append({
-                "name": f"🚨 SUBDOMAIN TAKEOVERS ({len(changes['new_takeovers'])})",
-                "value": takeover_list,
-                "inline": False
-            })
+        if n_takeovers:
+            takeover_list = []
+            for takeover in new_takeovers[:5]:
+                takeover_list.append(f"• **{takeover.get('subdomain', 'N/A')}**\n")
+                takeover_list.append(f"  Service: {takeover.get('service', 'unknown')}\n")
+                takeover_list.append(f"  CNAME: {takeover.get('cname', 'N/A')}\n")
+                takeover_list.append(f"  Confidence: {takeover.get('confidence', 'N/A')}\n")
+
+            fields.extend(_discord_fields(
+                f"🚨 SUBDOMAIN TAKEOVERS ({n_takeovers})",
+                ''.join(takeover_list)
+            ))
 
         # New endpoints
-        if changes.get('new_endpoints'):
-            endpoint_list = "\n".join([f"• {ep}" for ep in changes['new_endpoints'][:10]])
-            if len(changes['new_endpoints']) > 10:
-                endpoint_list += f"\n... and {len(changes['new_endpoints']) - 10} more"
+        if n_endpoints:
+            endpoint_list = "\n".join([f"• {ep}" for ep in new_endpoints[:10]])
+            if n_endpoints > 10:
+                endpoint_list += f"\n... and {n_endpoints - 10} more"
 
-            fields.append({
-                "name": f"🔗 New Endpoints ({len(changes['new_endpoints'])})",
-                "value": endpoint_list,
-                "inline": False
-            })
+            fields.extend(_discord_fields(
+                f"🔗 New Endpoints ({n_endpoints})",
+                endpoint_list
+            ))
 
         # Changed endpoints
-        if changes.get('changed_endpoints'):
-            changed_list = ""
-            for item in changes['changed_endpoints'][:5]:
+        if n_changed:
+            changed_list = []
+            for item in changed_endpoints[:5]:
                 url = item.get('url', 'N/A')
                 endpoint_changes = item.get('changes', {})
 
-                changed_list += f"**{url}**\n"
+                changed_list.append(f"**{url}**\n")
 
                 # Status code change
                 if 'status_code' in endpoint_changes:
                     sc = endpoint_changes['status_code']
-                    changed_list += f"  Status: {sc['old']} → {sc['new']}\n"
+                    changed_list.append(f"  Status: {sc['old']} → {sc['new']}\n")
 
                 # Title change
                 if 'title' in endpoint_changes:
                     tc = endpoint_changes['title']
                     old_title = tc['old'][:30] if tc['old'] else 'None'
                     new_title = tc['new'][:30] if tc['new'] else 'None'
-                    changed_list += f"  Title: {old_title}... → {new_title}...\n"
+                    changed_list.append(f"  Title: {old_title}... → {new_title}...\n")
 
                 # Body length change
                 if 'body_length' in endpoint_changes:
                     bl = endpoint_changes['body_length']
-                    changed_list += f"  Size: {bl['old']} → {bl['new']} ({bl['diff_percent']}%)\n"
+                    changed_list.append(f"  Size: {bl['old']} → {bl['new']} ({bl['diff_percent']}%)\n")
 
                 # Technologies
                 if 'technologies' in endpoint_changes:
                     tc = endpoint_changes['technologies']
                     if tc['added']:
-                        changed_list += f"  Tech Added: {', '.join(tc['added'])}\n"
+                        changed_list.append(f"  Tech Added: {', '.join(tc['added'])}\n")
 
                 # High-value flags
                 if 'new_flags' in endpoint_changes:
                     for flag in endpoint_changes['new_flags']:
-                        changed_list += f"  🚩 **{flag.get('message')}**\n"
+                        changed_list.append(f"  🚩 **{flag.get('message')}**\n")
 
-                changed_list += "\n"
+                changed_list.append("\n")
 
-            if len(changes['changed_endpoints']) > 5:
-                changed_list += f"... and {len(changes['changed_endpoints']) - 5} more\n"
+            if n_changed > 5:
+                changed_list.append(f"... and {n_changed - 5} more\n")
 
-            fields.append({
-                "name": f"🔄 Changed Endpoints ({len(changes['changed_endpoints'])})",
-                "value": changed_list or "No details",
-                "inline": False
-            })
+            fields.extend(_discord_fields(
+                f"🔄 Changed Endpoints ({n_changed})",
+                ''.join(changed_list) or "No details"
+            ))
 
         # New JS endpoints
-        if changes.get('new_js_endpoints'):
-            js_list = "\n".join([f"• {ep}" for ep in changes['new_js_endpoints'][:10]])
-            if len(changes['new_js_endpoints']) > 10:
-                js_list += f"\n... and {len(changes['new_js_endpoints']) - 10} more"
+        if n_js:
+            js_list = "\n".join([f"• {ep}" for ep in new_js_endpoints[:10]])
+            if n_js > 10:
+                js_list += f"\n... and {n_js - 10} more"
 
-            fields.append({
-                "name": f"📜 New JS Endpoints ({len(changes['new_js_endpoints'])})",
-                "value": js_list,
-                "inline": False
-            })
+            fields.extend(_discord_fields(
+                f"📜 New JS Endpoints ({n_js})",
+                js_list
+            ))
 
         embed = {
-            "title": "🔍 Monitoring Alert" if not is_critical else "🚨 CRITICAL ALERT",
+            "title": _DISCORD_CHANGE_TITLES[bool(is_critical)],
             "description": description,
             "color": color,
             "fields": fields,
             "timestamp": changes.get('timestamp', ''),
-            "footer": {"text": "BB-Monitor Change Detection"}
+            "footer": _DISCORD_CHANGE_FOOTER
         }
 
-        payload = {"embeds": [embed]}
-
-        try:
-            response = requests.post(webhook_url, json=payload, timeout=10)
-            if response.status_code == 204:
-                print("[+] Change notification sent to Discord")
-            else:
-                print(f"[!] Discord change notification failed: {response.status_code}")
-        except Exception as e:
-            print(f"[!] Discord change notification error: {e}")
+        for payload in _discord_messages(embed):
+            self._post('discord', webhook_url, payload, "Discord change notification",
+                       "Change notification sent to Discord")
@@ -14,6 +14,7 @@ import yaml
 import hashlib
 import subprocess
 import argparse
+import logging
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Set, Any
@@ -353,8 +354,16 @@ class BBMonitor:
                 else:
                     urls.append(subdomain)
 
-            # Use HTTPMonitor
-            http_monitor = HTTPMonitor(str(Path(self.config['monitoring']['data_dir']) / 'http_snapshots'))
+            # Use HTTPMonitor, sized like the httpx probing it replaces
+            max_workers = (
+                self.config.get('tools', {}).get('httpx', {}).get('threads')
+                or self.config.get('advanced', {}).get('max_workers')
+                or 20
+            )
+            http_monitor = HTTPMonitor(
+                str(Path(self.config['monitoring']['data_dir']) / 'http_snapshots'),
+                max_workers=int(max_workers)
+            )
             results_dict = http_monitor.probe_multiple(urls, parallel=True)
 
             # Convert to compatible format
@@ -371,7 +380,8 @@ class BBMonitor:
                         'server': data.get('server', ''),
                         'content_hash': data.get('content_hash', ''),
                         'flags': data.get('flags', []),
-                        'redirects': data.get('redirects', [])
+                        'redirect_count': data.get('redirect_count', 0),
+                        'final_url': data.get('final_url', url)
                     }
 
             print(f"{Colors.GREEN}[+] Found {len(results)} live endpoints{Colors.RESET}")
@@ -943,6 +953,12 @@ def main():
 
     args = parser.parse_args()
 
+    # Configure logging (modules report notification and API progress through it)
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
+
     monitor = BBMonitor(config_path=args.config)
 
     if args.init:
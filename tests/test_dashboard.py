@@ -0,0 +1,459 @@
+#!/usr/bin/env python3
+"""
+Unit tests for modules/dashboard.py - Dashboard data extraction
+"""
+
+import os
+import sys
+import json
+import time
+import unittest
+import tempfile
+import shutil
+from io import StringIO
+from pathlib import Path
+from unittest.mock import patch
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.dashboard import Dashboard, _read_json, _SUMMARY_CACHE_VERSION
+
+
+class TestDashboard(unittest.TestCase):
+    """Test cases for Dashboard class"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.test_dir = tempfile.mkdtemp()
+        self.data_dir = Path(self.test_dir)
+        (self.data_dir / 'baseline').mkdir()
+        (self.data_dir / 'diffs').mkdir()
+
+        self.baseline = {
+            'domain': 'example.com',
+            'timestamp': '2025-01-22T12:00:00',
+            'subdomains': {
+                'www.example.com': ['1.2.3.4'],
+                'api.example.com': ['1.2.3.5'],
+                'old.example.com': []
+            },
+            'endpoints': {
+                'https://www.example.com': {
+                    'status_code': 200,
+                    'title': 'Home',
+                    'technologies': ['Nginx', 'React'],
+                    'server': 'nginx',
+                    'flags': []
+                },
+                'https://api.example.com/admin': {
+                    'status_code': 403,
+                    'title': 'Forbidden',
+                    'technologies': ['Nginx'],
+                    'server': 'nginx',
+                    'flags': ['🎯 HIGH-VALUE: admin']
+                },
+                'https://api.example.com/v1': {
+                    'status_code': 502,
+                    'title': 'Bad Gateway',
+                    'technologies': ['PHP'],
+                    'server': 'Apache/2.2.15',
+                    'flags': ['⚠️ OUTDATED: Apache 2.2']
+                }
+            },
+            'subdomain_takeovers': [
+                {'subdomain': 'old.example.com', 'service': 'GitHub Pages', 'confidence': 'high'}
+            ]
+        }
+        self._write_json(self.data_dir / 'baseline' / 'example.com_baseline.json', self.baseline)
+
+        self.dashboard = Dashboard(data_dir=self.test_dir)
+
+    def tearDown(self):
+        """Clean up test fixtures"""
+        shutil.rmtree(self.test_dir)
+
+    def _write_json(self, path, data, mtime=None):
+        """Write a JSON fixture, optionally pinning its mtime"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(data, f)
+        if mtime is not None:
+            os.utime(path, (mtime, mtime))
+
+    def test_init_derives_directories(self):
+        """Test baseline/diff directories are derived from data_dir"""
+        self.assertEqual(self.dashboard.baseline_dir, self.data_dir / 'baseline')
+        self.assertEqual(self.dashboard.diff_dir, self.data_dir / 'diffs')
+
+    def test_get_all_baselines(self):
+        """Test baseline loading"""
+        baselines = self.dashboard.get_all_baselines()
+
+        self.assertIn('example.com', baselines)
+        self.assertEqual(len(baselines['example.com']['subdomains']), 3)
+
+    def test_get_all_baselines_cached(self):
+        """Test unchanged baselines are not re-parsed"""
+        first = self.dashboard.get_all_baselines()
+        with patch('modules.dashboard._read_json', wraps=_read_json) as mock_read:
+            second = self.dashboard.get_all_baselines()
+
+        mock_read.assert_not_called()
+        self.assertEqual(first, second)
+
+    def test_get_all_baselines_prunes_removed_files(self):
+        """Test parsed baselines are forgotten once their file is deleted"""
+        other = self.data_dir / 'baseline' / 'other.com_baseline.json'
+        self._write_json(other, {'subdomains': {}, 'endpoints': {}})
+        self.assertIn('other.com', self.dashboard.get_all_baselines())
+        self.assertIn(other, self.dashboard._json_cache)
+
+        other.unlink()
+        baselines = self.dashboard.get_all_baselines()
+
+        self.assertNotIn('other.com', baselines)
+        self.assertEqual(list(self.dashboard._json_cache),
+                         [self.data_dir / 'baseline' / 'example.com_baseline.json'])
+
+    def test_memoized_results_returned_as_copies(self):
+        """Test modifying a returned result does not corrupt later calls"""
+        self._write_json(self.data_dir / 'diffs' / 'example.com_20250122_120000.json',
+                         {'new_subdomains': ['new.example.com']})
+
+        stats = self.dashboard.get_statistics()
+        stats['recent_changes'].append({'total': 99})
+        stats['recent_changes'][0]['changes']['total'] = 99
+        stats['changes_24h']['new_subdomains'] += 5
+        findings = self.dashboard.get_security_findings()
+        findings['error_pages'].clear()
+        self.dashboard.get_all_baselines()['example.com']['subdomains'].clear()
+
+        stats = self.dashboard.get_statistics()
+        self.assertEqual(len(stats['recent_changes']), 1)
+        self.assertEqual(stats['recent_changes'][0]['changes']['total'], 1)
+        self.assertEqual(stats['changes_24h']['new_subdomains'], 1)
+        self.assertEqual(len(self.dashboard.get_security_findings()['error_pages']), 1)
+        self.assertEqual(self.dashboard.get_statistics()['total_subdomains'], 3)
+
+    def test_get_all_baselines_invalidated_on_change(self):
+        """Test baseline cache is invalidated when a file changes"""
+        self.dashboard.get_all_baselines()
+
+        self.baseline['subdomains']['new.example.com'] = ['1.2.3.6']
+        self._write_json(self.data_dir / 'baseline' / 'example.com_baseline.json',
+                         self.baseline, mtime=time.time() + 10)
+
+        baselines = self.dashboard.get_all_baselines()
+        self.assertEqual(len(baselines['example.com']['subdomains']), 4)
+
+    def test_get_subdomain_data(self):
+        """Test subdomain extraction with endpoint status"""
+        data = {s['subdomain']: s for s in self.dashboard.get_subdomain_data()}
+
+        self.assertEqual(data['www.example.com']['status'], 'Live')
+        self.assertEqual(data['www.example.com']['endpoint_count'], 1)
+        self.assertEqual(data['api.example.com']['endpoint_count'], 2)
+        self.assertEqual(data['old.example.com']['status'], 'Unknown')
+
+    def test_get_subdomain_data_matches_exact_host(self):
+        """Test endpoints are attributed by hostname, not substring"""
+        self.baseline['subdomains']['example.com'] = ['1.2.3.7']
+        self.baseline['subdomains']['Dev.Example.com'] = ['1.2.3.8']
+        self.baseline['endpoints']['https://www.example.com:8443/login'] = {'status_code': 200}
+        self.baseline['endpoints']['https://DEV.example.com/'] = {'status_code': 200}
+        self._write_json(self.data_dir / 'baseline' / 'example.com_baseline.json', self.baseline)
+
+        data = {s['subdomain']: s for s in Dashboard(data_dir=self.test_dir).get_subdomain_data()}
+
+        self.assertEqual(data['example.com']['endpoint_count'], 0)
+        self.assertEqual(data['www.example.com']['endpoint_count'], 2)
+        self.assertEqual(data['Dev.Example.com']['endpoint_count'], 1)
+
+    def test_get_technology_stats(self):
+        """Test technology and server counting"""
+        stats = self.dashboard.get_technology_stats()
+
+        self.assertEqual(stats['technologies']['Nginx'], 2)
+        self.assertEqual(stats['servers']['nginx'], 2)
+
+    def test_get_security_findings(self):
+        """Test security finding extraction"""
+        findings = self.dashboard.get_security_findings()
+
+        self.assertEqual(len(findings['subdomain_takeovers']), 1)
+        self.assertEqual(len(findings['high_value_targets']), 1)
+        self.assertEqual(len(findings['outdated_tech']), 1)
+        self.assertEqual(findings['outdated_tech'][0]['flag'], '⚠️ OUTDATED: Apache 2.2')
+        self.assertEqual(len(findings['error_pages']), 1)
+
+    def test_fused_endpoint_pass_memoized(self):
+        """Test technology stats and findings share one memoized endpoint pass"""
+        findings = self.dashboard.get_security_findings()
+        self.dashboard.get_technology_stats()
+
+        self.assertEqual(self.dashboard.get_security_findings(), findings)
+        self.assertEqual(len(self.dashboard._computed), 1)
+
+    def test_get_statistics(self):
+        """Test statistics aggregation from baselines and diffs"""
+        self._write_json(self.data_dir / 'diffs' / 'example.com_20250122_120000.json', {
+            'new_subdomains': ['new.example.com'],
+            'new_endpoints': ['https://new.example.com', 'https://www.example.com/x'],
+            'changed_endpoints': []
+        })
+
+        stats = self.dashboard.get_statistics()
+
+        self.assertEqual(stats['total_targets'], 1)
+        self.assertEqual(stats['total_subdomains'], 3)
+        self.assertEqual(stats['total_endpoints'], 3)
+        self.assertEqual(stats['live_endpoints'], 3)
+        self.assertEqual(stats['status_breakdown']['2xx'], 1)
+        self.assertEqual(stats['status_breakdown']['4xx'], 1)
+        self.assertEqual(stats['status_breakdown']['5xx'], 1)
+        self.assertEqual(stats['changes_24h']['new_subdomains'], 1)
+        self.assertEqual(stats['changes_7d']['new_endpoints'], 2)
+        self.assertEqual(len(stats['recent_changes']), 1)
+        self.assertEqual(stats['recent_changes'][0]['domain'], 'example.com')
+        self.assertEqual(stats['recent_changes'][0]['changes']['new_endpoints'], 2)
+        self.assertEqual(stats['recent_changes'][0]['total'], 3)
+
+    def test_get_statistics_change_windows(self):
+        """Test diffs are counted in the 24h and 7d windows by file time"""
+        now = time.time()
+        self._write_json(self.data_dir / 'diffs' / 'example.com_20250120_120000.json',
+                         {'new_subdomains': ['a.example.com']}, mtime=now - 2 * 86400)
+        self._write_json(self.data_dir / 'diffs' / 'example.com_20250110_120000.json',
+                         {'new_subdomains': ['b.example.com']}, mtime=now - 10 * 86400)
+
+        stats = self.dashboard.get_statistics()
+
+        self.assertEqual(stats['changes_24h']['new_subdomains'], 0)
+        self.assertEqual(stats['changes_7d']['new_subdomains'], 1)
+        self.assertEqual(len(stats['recent_changes']), 2)
+
+    def test_get_statistics_cached_until_diff_added(self):
+        """Test statistics are reused until a new diff file appears"""
+        first = self.dashboard._get_statistics()
+        self.assertIs(self.dashboard._get_statistics(), first)
+
+        self._write_json(self.data_dir / 'diffs' / 'example.com_20250122_120000.json',
+                         {'new_subdomains': ['new.example.com']})
+
+        stats = self.dashboard._get_statistics()
+        self.assertIsNot(stats, first)
+        self.assertEqual(stats['changes_24h']['new_subdomains'], 1)
+
+    def test_get_statistics_recomputed_when_diff_leaves_window(self):
+        """Test cached statistics expire once a diff ages out of the 24h window"""
+        now = time.time()
+        self._write_json(self.data_dir / 'diffs' / 'example.com_20250122_120000.json',
+                         {'new_subdomains': ['a.example.com']}, mtime=now - 86400 + 30)
+
+        self.assertEqual(self.dashboard.get_statistics()['changes_24h']['new_subdomains'], 1)
+
+        with patch('modules.dashboard.time.time', return_value=now + 60):
+            stats = self.dashboard.get_statistics()
+
+        self.assertEqual(stats['changes_24h']['new_subdomains'], 0)
+        self.assertEqual(stats['changes_7d']['new_subdomains'], 1)
+
+    def test_get_statistics_only_loads_new_diffs(self):
+        """Test a later pass only loads diff files that are new or rewritten"""
+        now = time.time()
+        self._write_json(self.data_dir / 'diffs' / 'example.com_20250122_120000.json',
+                         {'new_subdomains': ['a.example.com']}, mtime=now - 60)
+        self.dashboard.get_statistics()
+
+        self._write_json(self.data_dir / 'diffs' / 'example.com_20250122_130000.json',
+                         {'new_subdomains': ['b.example.com']}, mtime=now)
+        with patch.object(self.dashboard, '_load_json_cached',
+                          wraps=self.dashboard._load_json_cached) as mock_load:
+            stats = self.dashboard.get_statistics()
+
+        loaded = [call.args[0].name for call in mock_load.call_args_list]
+        self.assertEqual(loaded, ['example.com_20250122_130000.json'])
+        self.assertEqual(stats['changes_24h']['new_subdomains'], 2)
+
+    def test_get_statistics_recent_changes_newest_first(self):
+        """Test recent_changes keeps the 20 most recent changed diffs, newest first"""
+        now = time.time()
+        for i in range(25):
+            self._write_json(self.data_dir / 'diffs' / f'example.com_20250122_{i:06d}.json',
+                             {'new_endpoints': ['x'] * (i + 1)}, mtime=now - 3600 + i)
+
+        recent = self.dashboard.get_statistics()['recent_changes']
+
+        self.assertEqual(len(recent), 20)
+        self.assertEqual([c['total'] for c in recent], list(range(25, 5, -1)))
+
+    def test_summary_cache_persisted_across_instances(self):
+        """Test diff summaries written by one run are reused by the next"""
+        self._write_json(self.data_dir / 'diffs' / 'example.com_20250122_120000.json',
+                         {'new_subdomains': ['a.example.com']})
+        with patch('sys.stdout', new_callable=StringIO):
+            self.dashboard.render_simple(view='overview')
+
+        self.assertTrue((self.data_dir / '.dashboard_cache.json').exists())
+
+        dashboard = Dashboard(data_dir=self.test_dir)
+        with patch('modules.dashboard._read_json', wraps=_read_json) as mock_read:
+            stats = dashboard.get_statistics()
+
+        read_files = [call.args[0].name for call in mock_read.call_args_list]
+        self.assertNotIn('example.com_20250122_120000.json', read_files)
+        self.assertEqual(stats['changes_24h']['new_subdomains'], 1)
+
+    def test_summary_cache_discarded_on_version_mismatch(self):
+        """Test a persisted cache from another cache version is not reused"""
+        diff_file = self.data_dir / 'diffs' / 'example.com_20250122_120000.json'
+        self._write_json(diff_file, {'new_subdomains': ['a.example.com']})
+        with patch('sys.stdout', new_callable=StringIO):
+            self.dashboard.render_simple(view='overview')
+
+        cache_file = self.data_dir / '.dashboard_cache.json'
+        cache = json.loads(cache_file.read_text())
+        self.assertEqual(cache['version'], _SUMMARY_CACHE_VERSION)
+        self.assertIn(str(diff_file), cache['entries'])
+
+        # Same entries under an older version, and the pre-versioning flat layout
+        for stale in ({'version': _SUMMARY_CACHE_VERSION - 1, 'entries': cache['entries']},
+                      cache['entries']):
+            cache_file.write_text(json.dumps(stale))
+            dashboard = Dashboard(data_dir=self.test_dir)
+            self.assertEqual(dashboard._scan_cache, {})
+
+            with patch('modules.dashboard._read_json', wraps=_read_json) as mock_read:
+                stats = dashboard.get_statistics()
+
+            read_files = [call.args[0].name for call in mock_read.call_args_list]
+            self.assertIn(diff_file.name, read_files)
+            self.assertEqual(stats['changes_24h']['new_subdomains'], 1)
+
+    def test_get_statistics_only_recent_diffs(self):
+        """Test only the 50 most recent diff files are analyzed"""
+        now = time.time()
+        self._write_json(self.data_dir / 'diffs' / 'example.com_20250101_000000.json',
+                         {'new_subdomains': ['old.example.com']}, mtime=now - 3600)
+        for i in range(50):
+            self._write_json(self.data_dir / 'diffs' / f'example.com_20250102_{i:06d}.json',
+                             {'new_subdomains': []}, mtime=now - i)
+
+        stats = self.dashboard.get_statistics()
+
+        self.assertEqual(stats['recent_changes'], [])
+        self.assertEqual(stats['changes_7d']['new_subdomains'], 0)
+
+    def test_get_statistics_single_domain(self):
+        """Test filtering by domain only counts that target's baseline and diffs"""
+        other = dict(self.baseline, domain='other.com',
+                     subdomains={'www.other.com': []},
+                     endpoints={'https://www.other.com': {'status_code': 200}})
+        self._write_json(self.data_dir / 'baseline' / 'other.com_baseline.json', other)
+        self._write_json(self.data_dir / 'diffs' / 'example.com_20250122_120000.json',
+                         {'new_subdomains': ['new.example.com']})
+        self._write_json(self.data_dir / 'diffs' / 'other.com_20250122_120000.json',
+                         {'new_subdomains': ['a.other.com', 'b.other.com']})
+
+        stats = self.dashboard.get_statistics('other.com')
+
+        self.assertEqual(stats['total_targets'], 1)
+        self.assertEqual(stats['total_subdomains'], 1)
+        self.assertEqual(stats['total_endpoints'], 1)
+        self.assertEqual(stats['changes_24h']['new_subdomains'], 2)
+        self.assertEqual([c['domain'] for c in stats['recent_changes']], ['other.com'])
+
+        totals = self.dashboard.get_statistics()
+        self.assertEqual(totals['total_targets'], 2)
+        self.assertEqual(totals['changes_24h']['new_subdomains'], 3)
+
+    def test_render_endpoints_grouped_by_status_class(self):
+        """Test endpoint view groups status codes into their classes"""
+        with patch('sys.stdout', new_callable=StringIO) as out:
+            self.dashboard.render_simple(view='endpoints')
+
+        output = out.getvalue()
+        self.assertIn('[200] https://www.example.com', output)
+        self.assertLess(output.index('4XX - CLIENT ERRORS'), output.index('[403]'))
+        self.assertLess(output.index('5XX - SERVER ERRORS'), output.index('[502]'))
+        self.assertNotIn('3XX - REDIRECTS', output)
+
+    def test_render_all_computes_statistics_once(self):
+        """Test the 'all' view computes statistics a single time"""
+        with patch.object(self.dashboard, '_get_statistics',
+                          wraps=self.dashboard._get_statistics) as mock_stats, \
+                patch('sys.stdout', new_callable=StringIO) as out:
+            self.dashboard.render_simple(view='all')
+
+        mock_stats.assert_called_once()
+        self.assertIn('SECURITY FINDINGS', out.getvalue())
+        self.assertIn('TECHNOLOGY STACK', out.getvalue())
+
+    def test_render_views_only_load_what_they_show(self):
+        """Test single-section views skip the diff scan and unrelated baselines"""
+        with patch.object(self.dashboard, '_get_statistics') as mock_stats, \
+                patch.object(self.dashboard, '_get_baselines',
+                             wraps=self.dashboard._get_baselines) as mock_baselines, \
+                patch('sys.stdout', new_callable=StringIO):
+            self.dashboard.render_simple(view='shodan')
+            self.dashboard.render_simple(view='wayback')
+            mock_baselines.assert_not_called()
+
+            self.dashboard.render_simple(view='subdomains')
+            self.dashboard.render_simple(view='endpoints')
+
+        mock_stats.assert_not_called()
+
+    def test_get_shodan_data_latest_file(self):
+        """Test the most recent Shodan scan per domain is used"""
+        shodan_dir = self.data_dir / 'shodan_scans'
+        now = time.time()
+        self._write_json(shodan_dir / 'example.com_20250101_000000.json',
+                         {'summary': {'total_hosts': 1}, 'hosts': {}}, mtime=now - 100)
+        self._write_json(shodan_dir / 'example.com_20250102_000000.json',
+                         {'summary': {'total_hosts': 2}, 'hosts': {
+                             '1.2.3.4': {'ports': [80, 443], 'vulns': ['CVE-2021-1234'],
+                                         'hostnames': ['www.example.com'], 'data': []}
+                         }}, mtime=now)
+
+        shodan_data = self.dashboard.get_shodan_data()
+
+        self.assertEqual(list(shodan_data), ['example.com'])
+        data = shodan_data['example.com']
+        self.assertEqual(data['total_hosts'], 2)
+        self.assertEqual(data['findings']['vulnerabilities'][0]['hostname'], 'www.example.com')
+        # Only the extracted summary is cached, not the raw host dump
+        self.assertEqual(self.dashboard._json_cache, {})
+
+    def test_get_shodan_data_host_without_hostnames(self):
+        """Test a host with an empty hostnames list does not drop the domain"""
+        self._write_json(self.data_dir / 'shodan_scans' / 'example.com_20250102_000000.json', {
+            'summary': {'total_hosts': 1},
+            'hosts': {'1.2.3.4': {'vulns': ['CVE-2021-1234'], 'hostnames': []}}
+        })
+
+        shodan_data = self.dashboard.get_shodan_data()
+
+        vulns = shodan_data['example.com']['findings']['vulnerabilities']
+        self.assertEqual(vulns[0]['hostname'], '')
+
+    def test_get_wayback_data_top_samples(self):
+        """Test Wayback samples keep the top 5 URLs by score"""
+        items = [{'url': f'https://example.com/{i}.bak', 'priority': 'high', 'score': i}
+                 for i in range(10)]
+        self._write_json(self.data_dir / 'wayback_scans' / 'example.com_20250102_000000.json', {
+            'total_urls': 10,
+            'statistics': {'by_priority': {'high': 10}, 'by_category': {'backup': 10}},
+            'categorized': {'backup': items}
+        })
+
+        wayback_data = self.dashboard.get_wayback_data()
+
+        data = wayback_data['example.com']
+        scores = [item['score'] for item in data['category_samples']['backup']]
+        self.assertEqual(scores, [9, 8, 7, 6, 5])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -8,9 +8,12 @@ import sys
 import unittest
 import tempfile
 import shutil
+import hashlib
 from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
 
+import requests
+
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -43,6 +46,7 @@ class TestHTTPMonitor(unittest.TestCase):
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.content = b'<html><head><title>Test Page</title></head><body>Content</body></html>'
+        mock_response.iter_content.return_value = [mock_response.content]
         mock_response.headers = {
             'Server': 'Apache/2.4.41',
             'Content-Type': 'text/html'
@@ -58,6 +62,158 @@ class TestHTTPMonitor(unittest.TestCase):
         self.assertGreater(result['body_length'], 0)
         self.assertEqual(result['server'], 'Apache/2.4.41')
 
+    @patch('modules.http_monitor.requests.Session.get')
+    def test_probe_url_title_extraction(self, mock_get):
+        """Test the title is unescaped and stripped regardless of tag case"""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = b'<HTML><HEAD><TITLE lang="en">\n  Admin &amp; Login \n</TITLE></HEAD></HTML>'
+        mock_response.iter_content.return_value = [mock_response.content]
+        mock_response.headers = {'Content-Type': 'text/html; charset=utf-8'}
+        mock_response.history = []
+        mock_get.return_value = mock_response
+
+        result = self.monitor.probe_url('https://example.com')
+
+        self.assertEqual(result['title'], 'Admin & Login')
+
+    @patch('modules.http_monitor.requests.Session.get')
+    def test_probe_url_title_non_utf8(self, mock_get):
+        """Test titles are decoded with the charset from the header, a meta tag, or detection"""
+        pages = [
+            ('text/html; charset=ISO-8859-1', '<title>Café Déjà Vu</title>'.encode('latin-1'), 'Café Déjà Vu'),
+            ('text/html', '<meta charset="windows-1251"><title>Вход в систему</title>'.encode('cp1251'),
+             'Вход в систему'),
+            ('text/html', '<meta http-equiv="Content-Type" content="text/html; charset=Shift_JIS">'
+                          '<title>ログイン</title>'.encode('shift_jis'), 'ログイン'),
+            ('text/html', ('<html><head><title>Панель администратора</title></head><body>'
+                           + 'Добро пожаловать в панель управления сайтом. ' * 20 + '</body></html>').encode('cp1251'),
+             'Панель администратора'),
+        ]
+
+        for content_type, body, title in pages:
+            mock_response = Mock()
+            mock_response.status_code = 200
+            mock_response.content = body
+            mock_response.iter_content.return_value = [body]
+            mock_response.headers = {'Content-Type': content_type}
+            mock_response.history = []
+            mock_get.return_value = mock_response
+
+            result = self.monitor.probe_url('https://example.com')
+
+            self.assertEqual(result['title'], title)
+
+    @patch('modules.http_monitor._BODY_KEEP_BYTES', 16)
+    @patch('modules.http_monitor.requests.Session.get')
+    def test_probe_url_streams_body(self, mock_get):
+        """Test the whole body is hashed and counted while only the head is kept"""
+        chunks = [b'<title>Big</title>', b'x' * 100, b'wp-content']
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {'Content-Type': 'text/html'}
+        mock_response.history = []
+        mock_response.iter_content.return_value = chunks
+        mock_get.return_value = mock_response
+
+        result = self.monitor.probe_url('https://example.com')
+
+        body = b''.join(chunks)
+        self.assertEqual(result['body_length'], len(body))
+        self.assertEqual(result['content_hash'], hashlib.sha256(body).hexdigest())
+        self.assertNotIn('WordPress', result['technologies'])
+        self.assertTrue(mock_get.call_args.kwargs['stream'])
+        mock_response.close.assert_called_once()
+
+    @patch('modules.http_monitor.requests.Session.get')
+    def test_probe_url_non_html_skips_content_detection(self, mock_get):
+        """Test non-HTML bodies only get header-based technology detection"""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {'Content-Type': 'application/json', 'Server': 'nginx'}
+        mock_response.history = []
+        mock_response.iter_content.return_value = [b'{"path": "/wp-content/", "lib": "jquery-3.6.0"}']
+        mock_get.return_value = mock_response
+
+        result = self.monitor.probe_url('https://api.example.com')
+
+        self.assertEqual(result['technologies'], ['nginx'])
+
+    @patch('modules.http_monitor.requests.Session.get')
+    def test_probe_url_records_redirect_summary(self, mock_get):
+        """Test redirects are stored as a hop count and final URL"""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {'Content-Type': 'text/plain'}
+        mock_response.history = [Mock(url='http://example.com'), Mock(url='https://example.com')]
+        mock_response.url = 'https://www.example.com/'
+        mock_response.iter_content.return_value = [b'ok']
+        mock_get.return_value = mock_response
+
+        result = self.monitor.probe_url('http://example.com')
+
+        self.assertEqual(result['redirect_count'], 2)
+        self.assertEqual(result['final_url'], 'https://www.example.com/')
+        self.assertNotIn('redirects', result)
+        self.assertTrue(any(f['type'] == 'redirect' for f in result['flags']))
+
+        monitor = HTTPMonitor(output_dir=self.test_dir, keep_redirect_chain=True)
+        result = monitor.probe_url('http://example.com')
+        self.assertEqual(result['redirects'], ['http://example.com', 'https://example.com'])
+
+    @patch('modules.http_monitor.requests.Session.get')
+    def test_probe_url_keeps_relevant_headers(self, mock_get):
+        """Test only the headers used for detection and flagging are stored"""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = requests.structures.CaseInsensitiveDict({
+            'content-type': 'text/html',
+            'x-frame-options': 'DENY',
+            'Set-Cookie': 'session=abc',
+            'Date': 'Thu, 30 Jan 2025 10:00:00 GMT'
+        })
+        mock_response.history = []
+        mock_response.iter_content.return_value = [b'<html></html>']
+        mock_get.return_value = mock_response
+
+        result = self.monitor.probe_url('https://example.com')
+
+        self.assertEqual(result['headers'], {'Content-Type': 'text/html', 'X-Frame-Options': 'DENY'})
+        security_flags = [f for f in result['flags'] if f['type'] == 'security']
+        self.assertNotIn('X-Frame-Options', security_flags[0]['message'])
+
+    @patch('modules.http_monitor.requests.Session.get')
+    def test_probe_url_fingerprints_xhtml(self, mock_get):
+        """Test XHTML responses get title and content detection"""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {'Content-Type': 'Application/XHTML+XML; charset=utf-8'}
+        mock_response.history = []
+        mock_response.iter_content.return_value = [b'<html><head><title>Portal</title></head>joomla</html>']
+        mock_get.return_value = mock_response
+
+        result = self.monitor.probe_url('https://example.com')
+
+        self.assertEqual(result['title'], 'Portal')
+        self.assertIn('Joomla', result['technologies'])
+
+    @patch('modules.http_monitor.requests.Session.get')
+    def test_probe_url_xml_fingerprinted_without_title(self, mock_get):
+        """Test XML feeds get content detection but no page title"""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {'Content-Type': 'application/xml'}
+        mock_response.history = []
+        mock_response.iter_content.return_value = [
+            b'<rss><channel><title>Admin login feed</title>joomla</channel></rss>']
+        mock_get.return_value = mock_response
+
+        result = self.monitor.probe_url('https://example.com/feed')
+
+        self.assertEqual(result['title'], '')
+        self.assertIn('Joomla', result['technologies'])
+        self.assertFalse(any('title' in f['message'] for f in result['flags']))
+
     @patch('modules.http_monitor.requests.Session.get')
     def test_probe_url_timeout(self, mock_get):
         """Test URL probing with timeout"""
@@ -106,6 +262,29 @@ class TestHTTPMonitor(unittest.TestCase):
 
         self.assertTrue(any('jQuery' in tech for tech in technologies))
 
+    def test_detect_technologies_versions_from_body(self):
+        """Test versions are extracted from the raw body bytes"""
+        mock_response = Mock()
+        mock_response.headers = {'X-Powered-By': 'PHP/7.4.3'}
+        body = b'<meta name="generator" content="WordPress 6.1.1"><link href="/wp-content/bootstrap-5.2.3.css">'
+
+        technologies = self.monitor.detect_technologies(mock_response, body)
+
+        self.assertIn('WordPress 6.1.1', technologies)
+        self.assertIn('Bootstrap 5.2.3', technologies)
+        self.assertIn('PHP/7.4.3', technologies)
+
+    def test_detect_technologies_scans_head_only(self):
+        """Test fingerprints beyond the scanned head of a large body are ignored"""
+        mock_response = Mock()
+        mock_response.headers = {}
+        body = b'<script src="/js/jquery-3.6.0.min.js"></script>' + b' ' * 300000 + b'drupal'
+
+        technologies = self.monitor.detect_technologies(mock_response, body)
+
+        self.assertIn('jQuery 3.6.0', technologies)
+        self.assertNotIn('Drupal', technologies)
+
     def test_flag_admin_panel(self):
         """Test flagging admin panels"""
         result = {
@@ -286,6 +465,22 @@ class TestHTTPMonitor(unittest.TestCase):
         self.assertGreater(len(tech_changes), 0)
         self.assertIn('PHP', tech_changes[0]['technologies'])
 
+    def test_compare_results_technology_order_ignored(self):
+        """Test reordered technology lists are not reported as changes"""
+        old = {
+            'url': 'https://example.com',
+            'timestamp': '2025-01-30T10:00:00',
+            'status_code': 200,
+            'technologies': ['Apache', 'PHP', 'jQuery 3.6.0'],
+            'flags': []
+        }
+        new = dict(old, timestamp='2025-01-30T11:00:00',
+                   technologies=['jQuery 3.6.0', 'Apache', 'PHP'])
+
+        changes = self.monitor.compare_results(old, new)
+
+        self.assertFalse(changes['has_changes'])
+
     def test_compare_results_no_changes(self):
         """Test comparing identical results"""
         data = {
@@ -357,6 +552,25 @@ class TestHTTPMonitor(unittest.TestCase):
 
         self.assertEqual(len(results), 3)
 
+    def test_connection_pool_covers_workers(self):
+        """Test the session pool holds a connection for every worker thread"""
+        monitor = HTTPMonitor(output_dir=self.test_dir, max_workers=200)
+        adapter = monitor.session.get_adapter('https://example.com')
+
+        self.assertEqual(monitor.max_workers, 200)
+        self.assertGreaterEqual(adapter._pool_maxsize, 200)
+
+    def test_probe_multiple_shares_session(self):
+        """Test every probe reuses the monitor's pooled session"""
+        with patch.object(requests.Session, 'get', autospec=True) as mock_get:
+            mock_get.side_effect = requests.exceptions.ConnectionError()
+            urls = ['https://example.com/a', 'https://example.com/b', 'https://example.com/c']
+            self.monitor.probe_multiple(urls, parallel=True)
+
+        sessions = {id(call.args[0]) for call in mock_get.call_args_list}
+        self.assertEqual(sessions, {id(self.monitor.session)})
+        self.assertFalse(self.monitor.session.verify)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -71,7 +71,7 @@ class TestIntegration(unittest.TestCase):
         """Clean up test fixtures"""
         shutil.rmtree(self.test_dir)
 
-    @patch('modules.notifier.requests.post')
+    @patch('modules.notifier.requests.Session.post')
     @patch('monitor.BBMonitor.probe_http')
     @patch('monitor.BBMonitor.discover_subdomains')
     def test_full_init_workflow(self, mock_discover, mock_probe, mock_post):
@@ -140,7 +140,7 @@ class TestIntegration(unittest.TestCase):
         embed = payload['embeds'][0]
         self.assertIn('Baseline', embed['title'])
 
-    @patch('modules.notifier.requests.post')
+    @patch('modules.notifier.requests.Session.post')
     @patch('monitor.BBMonitor.probe_http')
     @patch('monitor.BBMonitor.discover_subdomains')
     def test_full_monitoring_workflow_no_changes(self, mock_discover, mock_probe, mock_post):
@@ -201,7 +201,7 @@ class TestIntegration(unittest.TestCase):
             # Should not have change notification
             self.assertFalse('Monitoring Alert' in str(payload))
 
-    @patch('modules.notifier.requests.post')
+    @patch('modules.notifier.requests.Session.post')
     @patch('monitor.BBMonitor.probe_http')
     @patch('monitor.BBMonitor.discover_subdomains')
     def test_full_monitoring_workflow_with_changes(self, mock_discover, mock_probe, mock_post):
@@ -302,7 +302,7 @@ class TestIntegration(unittest.TestCase):
         self.assertIn('new-api.example.com', diff_data['new_subdomains'])
         self.assertEqual(len(diff_data['changed_endpoints']), 1)
 
-    @patch('modules.notifier.requests.post')
+    @patch('modules.notifier.requests.Session.post')
     @patch('monitor.BBMonitor.probe_http')
     @patch('monitor.BBMonitor.discover_subdomains')
     def test_monitoring_with_subdomain_takeover(self, mock_discover, mock_probe, mock_post):
@@ -369,7 +369,7 @@ class TestIntegration(unittest.TestCase):
         takeover_field = next((f for f in fields if 'TAKEOVER' in f['name']), None)
         self.assertIsNotNone(takeover_field)
 
-    @patch('modules.notifier.requests.post')
+    @patch('modules.notifier.requests.Session.post')
     @patch('monitor.BBMonitor.discover_subdomains')
     def test_first_time_monitoring_sends_baseline_alert(self, mock_discover, mock_post):
         """Test that first-time monitoring sends baseline alert"""
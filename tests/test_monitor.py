@@ -405,6 +405,27 @@ class TestBBMonitor(unittest.TestCase):
         self.assertIn('endpoints', baseline)
         self.assertEqual(len(baseline['subdomains']), 2)
 
+    @patch('monitor.ENHANCED_HTTP', True)
+    @patch('monitor.HTTPMonitor')
+    def test_probe_http_workers_from_config(self, mock_http_monitor):
+        """Test the HTTP probe pool is sized from tools.httpx.threads, then advanced.max_workers"""
+        mock_http_monitor.return_value.probe_multiple.return_value = {}
+
+        self.config['tools']['httpx'] = {'enabled': True, 'threads': 35}
+        self.config['advanced'] = {'max_workers': 10}
+        monitor = BBMonitor(config_path=self.config_file)
+        monitor.config = self.config
+        monitor.probe_http({'sub1.example.com'})
+        self.assertEqual(mock_http_monitor.call_args[1]['max_workers'], 35)
+
+        del self.config['tools']['httpx']
+        monitor.probe_http({'sub1.example.com'})
+        self.assertEqual(mock_http_monitor.call_args[1]['max_workers'], 10)
+
+        del self.config['advanced']
+        monitor.probe_http({'sub1.example.com'})
+        self.assertEqual(mock_http_monitor.call_args[1]['max_workers'], 20)
+
     @patch('modules.notifier.Notifier')
     @patch('monitor.BBMonitor.collect_baseline')
     def test_run_initial_baseline(self, mock_collect, mock_notifier):
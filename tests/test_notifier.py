@@ -5,6 +5,7 @@ Unit tests for modules/notifier.py - Notification functionality
 
 import os
 import sys
+import threading
 import unittest
 from unittest.mock import Mock, patch, MagicMock, call
 
@@ -47,11 +48,50 @@ class TestNotifier(unittest.TestCase):
             }
         }
 
+    def _discord_payload(self, mock_post):
+        """Return the JSON payload posted to the Discord webhook (channels are sent concurrently)"""
+        for posted in mock_post.call_args_list:
+            if 'discord' in posted[0][0]:
+                return posted[1]['json']
+        self.fail('No Discord notification sent')
+
     def test_init(self):
         """Test Notifier initialization"""
         notifier = Notifier(self.config)
         self.assertEqual(notifier.config, self.config)
 
+    @patch('modules.notifier.requests.Session.post')
+    def test_missing_channel_is_disabled(self, mock_post):
+        """Test a channel absent from the config is treated as disabled"""
+        notifier = Notifier({'discord': self.config['discord']})
+
+        notifier.send_slack('message', {})
+        notifier.notify_changes('example.com', {'new_subdomains': ['new.example.com']})
+
+        self.assertEqual(mock_post.call_count, 1)
+        self.assertIn('discord', mock_post.call_args[0][0])
+
+    def test_shared_session_retries_rate_limits(self):
+        """Test webhook posts share a pooled session that only retries undelivered sends"""
+        from modules import notifier as notifier_module
+
+        adapter = notifier_module._session.get_adapter('https://hooks.slack.com/test')
+        retry = adapter.max_retries
+
+        self.assertIn(429, retry.status_forcelist)
+        self.assertTrue(retry.is_retry('POST', 429))
+
+        # Statuses that may follow a delivered message are not resent
+        for status in (500, 502, 503, 504):
+            self.assertFalse(retry.is_retry('POST', status))
+        self.assertTrue(retry.is_retry('POST', 503, has_retry_after=True))
+        self.assertEqual(retry.read, 0)
+
+        # A long Retry-After is capped rather than stalling the dispatch
+        throttled = Mock(headers={'Retry-After': '3600'})
+        self.assertEqual(retry.get_retry_after(throttled), notifier_module._RETRY_AFTER_MAX)
+        self.assertEqual(retry.get_retry_after(Mock(headers={'Retry-After': '2'})), 2)
+
     def test_should_notify(self):
         """Test should_notify logic"""
         notifier = Notifier(self.config)
@@ -63,7 +103,7 @@ class TestNotifier(unittest.TestCase):
         # Should not notify
         self.assertFalse(notifier.should_notify('changed_endpoint', self.config['slack']))
 
-    @patch('modules.notifier.requests.post')
+    @patch('modules.notifier.requests.Session.post')
     def test_send_slack(self, mock_post):
         """Test Slack notification"""
         mock_response = Mock()
@@ -86,7 +126,22 @@ class TestNotifier(unittest.TestCase):
         payload = call_args[1]['json']
         self.assertIn('blocks', payload)
 
-    @patch('modules.notifier.requests.post')
+    @patch('modules.notifier.requests.Session.post')
+    def test_send_failures_are_logged(self, mock_post):
+        """Test rejected and failed posts are reported through the module logger"""
+        mock_post.side_effect = [Mock(status_code=400), ConnectionError('refused')]
+        notifier = Notifier(self.config)
+
+        with self.assertLogs('modules.notifier', level='WARNING') as logs:
+            notifier.send_slack("Test message", {})
+            notifier.send_slack("Test message", {})
+
+        failed, error = logs.records
+        self.assertEqual((failed.levelname, failed.getMessage()), ('WARNING', 'Slack notification failed: 400'))
+        self.assertEqual((error.levelname, error.getMessage()), ('ERROR', 'Slack notification error: refused'))
+        self.assertIsNotNone(error.exc_info)  # Traceback kept for diagnosis
+
+    @patch('modules.notifier.requests.Session.post')
     def test_send_discord(self, mock_post):
         """Test Discord notification"""
         mock_response = Mock()
@@ -109,7 +164,7 @@ class TestNotifier(unittest.TestCase):
         payload = call_args[1]['json']
         self.assertIn('embeds', payload)
 
-    @patch('modules.notifier.requests.post')
+    @patch('modules.notifier.requests.Session.post')
     def test_send_telegram(self, mock_post):
         """Test Telegram notification"""
         # Enable telegram
@@ -135,7 +190,7 @@ class TestNotifier(unittest.TestCase):
         url = call_args[0][0]
         self.assertIn('telegram.org', url)
 
-    @patch('modules.notifier.requests.post')
+    @patch('modules.notifier.requests.Session.post')
     def test_send_baseline_alert_discord(self, mock_post):
         """Test baseline alert to Discord"""
         mock_response = Mock()
@@ -169,19 +224,63 @@ class TestNotifier(unittest.TestCase):
 
         notifier.send_baseline_alert('example.com', baseline)
 
-        # Should send to Discord (enabled with baseline_complete in notify_on)
-        self.assertTrue(mock_post.called)
+        # Should send to Slack and Discord (both enabled with baseline_complete in notify_on)
+        self.assertEqual(mock_post.call_count, 2)
 
         # Check payload
-        call_args = mock_post.call_args
-        payload = call_args[1]['json']
+        payload = self._discord_payload(mock_post)
         self.assertIn('embeds', payload)
 
         embed = payload['embeds'][0]
         self.assertIn('Baseline Scan Complete', embed['title'])
         self.assertIn('fields', embed)
 
-    @patch('modules.notifier.requests.post')
+    def test_send_baseline_alert_summary_counts(self):
+        """Test status buckets and high-value targets in the baseline summary"""
+        notifier = Notifier(self.config)
+
+        baseline = {
+            'subdomains': {'a.example.com': True},
+            'endpoints': {
+                'https://a.example.com': {'status_code': 200, 'flags': ['Admin panel']},
+                'https://a.example.com/login': {'status_code': 302},
+                'https://a.example.com/upload': {'status_code': 403, 'flags': ['file-upload', 'upload']},
+                'https://a.example.com/err': {'status_code': 503, 'flags': ['slow']},
+                'https://b.example.com': {'status_code': None}
+            }
+        }
+
+        with patch.object(notifier, '_send_slack_baseline') as mock_send, \
+             patch.object(notifier, '_send_discord_baseline'):
+            notifier.send_baseline_alert('example.com', baseline)
+
+        summary = mock_send.call_args[0][0]
+        self.assertEqual(summary['endpoints'], {
+            'total': 5, 'live': 4,
+            'status_2xx': 1, 'status_3xx': 1, 'status_4xx': 1, 'status_5xx': 1
+        })
+        self.assertEqual(summary['security']['high_value_list'],
+                         ['https://a.example.com', 'https://a.example.com/upload'])
+
+    @patch('modules.notifier.requests.Session.post')
+    def test_send_baseline_alert_channels_concurrent(self, mock_post):
+        """Test channels are sent in parallel rather than one after another"""
+        barrier = threading.Barrier(2, timeout=5)
+        met = []
+
+        def post(url, **kwargs):
+            barrier.wait()  # Only returns once both channels are in flight
+            met.append(url)
+            return Mock(status_code=204 if 'discord' in url else 200)
+
+        mock_post.side_effect = post
+
+        notifier = Notifier(self.config)
+        notifier.send_baseline_alert('example.com', {'subdomains': {}, 'endpoints': {}})
+
+        self.assertEqual(len(met), 2)
+
+    @patch('modules.notifier.requests.Session.post')
     def test_send_baseline_alert_not_in_notify_on(self, mock_post):
         """Test baseline alert when not in notify_on list"""
         # Remove baseline_complete from ALL notify_on lists
@@ -204,7 +303,18 @@ class TestNotifier(unittest.TestCase):
         # Should NOT send to any platform (baseline_complete not in notify_on)
         mock_post.assert_not_called()
 
-    @patch('modules.notifier.requests.post')
+    def test_send_baseline_alert_unsubscribed_skips_summary(self):
+        """Test the baseline is not summarised when no channel wants it"""
+        self.config['slack']['notify_on'] = ['new_subdomain']
+        self.config['discord']['notify_on'] = ['new_subdomain']
+        notifier = Notifier(self.config)
+
+        baseline = MagicMock()
+        notifier.send_baseline_alert('example.com', baseline)
+
+        baseline.get.assert_not_called()
+
+    @patch('modules.notifier.requests.Session.post')
     def test_notify_changes_new_subdomains(self, mock_post):
         """Test change notification for new subdomains"""
         mock_response = Mock()
@@ -230,12 +340,11 @@ class TestNotifier(unittest.TestCase):
         self.assertTrue(mock_post.called)
 
         # Check that it's a change notification, not baseline
-        call_args = mock_post.call_args
-        payload = call_args[1]['json']
+        payload = self._discord_payload(mock_post)
         embed = payload['embeds'][0]
         self.assertIn('Monitoring', embed['title'])
 
-    @patch('modules.notifier.requests.post')
+    @patch('modules.notifier.requests.Session.post')
     def test_notify_changes_critical_takeover(self, mock_post):
         """Test critical notification for subdomain takeover"""
         mock_response = Mock()
@@ -278,7 +387,7 @@ class TestNotifier(unittest.TestCase):
         self.assertIn('CRITICAL', embed['title'])
         self.assertEqual(embed['color'], 15158332)  # Red color
 
-    @patch('modules.notifier.requests.post')
+    @patch('modules.notifier.requests.Session.post')
     def test_notify_changes_changed_endpoints(self, mock_post):
         """Test notification for changed endpoints"""
         mock_response = Mock()
@@ -332,7 +441,7 @@ class TestNotifier(unittest.TestCase):
         self.assertIsNotNone(changed_field)
         self.assertIn('Status: 403', changed_field['value'])
 
-    @patch('modules.notifier.requests.post')
+    @patch('modules.notifier.requests.Session.post')
     def test_notify_changes_no_changes(self, mock_post):
         """Test notification when no changes"""
         notifier = Notifier(self.config)
@@ -353,7 +462,7 @@ class TestNotifier(unittest.TestCase):
         # Should NOT send notification (no changes)
         mock_post.assert_not_called()
 
-    @patch('modules.notifier.requests.post')
+    @patch('modules.notifier.requests.Session.post')
     def test_discord_changes_with_flags(self, mock_post):
         """Test Discord notification with high-value flags"""
         mock_response = Mock()
@@ -397,7 +506,7 @@ class TestNotifier(unittest.TestCase):
         # Should be critical
         self.assertIn('CRITICAL', embed['title'])
 
-    @patch('modules.notifier.requests.post')
+    @patch('modules.notifier.requests.Session.post')
     def test_send_discord_changes_detailed(self, mock_post):
         """Test detailed Discord change notification"""
         mock_response = Mock()
@@ -446,6 +555,89 @@ class TestNotifier(unittest.TestCase):
         self.assertTrue(any('Changed Endpoints' in name for name in field_names))
         self.assertTrue(any('New JS Endpoints' in name for name in field_names))
 
+    @patch('modules.notifier.requests.Session.post')
+    def test_send_discord_changes_splits_long_fields(self, mock_post):
+        """Test long lists are continued in further fields within Discord's 1024 character limit"""
+        mock_post.return_value = Mock(status_code=204)
+        notifier = Notifier(self.config)
+
+        endpoints = [f"https://example.com/{i}/" + 'a' * 200 for i in range(10)]
+        notifier._send_discord_changes('example.com', {'new_endpoints': endpoints})
+
+        fields = mock_post.call_args[1]['json']['embeds'][0]['fields']
+        self.assertEqual([field['name'] for field in fields],
+                         ['🔗 New Endpoints (10)'] + ['🔗 New Endpoints (10) (cont.)'] * 2)
+        self.assertTrue(all(len(field['value']) <= 1024 for field in fields))
+        self.assertEqual('\n'.join(field['value'] for field in fields),
+                         '\n'.join(f"• {ep}" for ep in endpoints))
+
+    @patch('modules.notifier.requests.Session.post')
+    def test_send_discord_changes_spills_into_follow_up_messages(self, mock_post):
+        """Test an alert over Discord's 6000 character message limit is continued in further messages"""
+        mock_post.return_value = Mock(status_code=204)
+        notifier = Notifier(self.config)
+
+        changes = {
+            'new_subdomains': [f"{i}-" + 'a' * 240 + '.example.com' for i in range(10)],
+            'new_endpoints': [f"https://example.com/{i}/" + 'b' * 480 for i in range(10)],
+            'new_js_endpoints': [f"/static/{i}/" + 'c' * 480 + '.js' for i in range(10)]
+        }
+        notifier._send_discord_changes('example.com', changes)
+
+        embeds = [posted[1]['json']['embeds'] for posted in mock_post.call_args_list]
+        self.assertGreater(len(embeds), 1)
+        for message in embeds:
+            self.assertEqual(len(message), 1)
+            embed = message[0]
+            size = (len(embed.get('title', '')) + len(embed.get('description', ''))
+                    + len(embed.get('footer', {}).get('text', ''))
+                    + sum(len(field['name']) + len(field['value']) for field in embed['fields']))
+            self.assertLessEqual(size, 6000)
+            self.assertLessEqual(len(embed['fields']), 25)
+
+        # Every entry still arrives, with follow-ups titled as continuations
+        self.assertEqual(embeds[0][0]['title'], '🔍 Monitoring Alert')
+        self.assertTrue(all(message[0]['title'] == '🔍 Monitoring Alert (cont.)' for message in embeds[1:]))
+        text = '\n'.join(field['value'] for message in embeds for field in message[0]['fields'])
+        for entry in changes['new_subdomains'] + changes['new_endpoints'] + changes['new_js_endpoints']:
+            self.assertIn(f"• {entry}", text)
+
+    @patch('modules.notifier._smtp_connections', {})
+    @patch('modules.notifier.smtplib.SMTP')
+    def test_email_reuses_smtp_connection(self, mock_smtp):
+        """Test consecutive emails share one SMTP login"""
+        server = mock_smtp.return_value
+        server.noop.return_value = (250, b'OK')
+        self.config['email']['enabled'] = True
+        notifier = Notifier(self.config)
+
+        notifier.send_email('First', 'message', {'new_subdomains': ['a.example.com']})
+        notifier.send_email('Second', 'message', {'new_subdomains': ['b.example.com']})
+
+        mock_smtp.assert_called_once_with('smtp.test.com', 587, timeout=30)
+        server.login.assert_called_once_with('test@test.com', 'password')
+        self.assertEqual(server.send_message.call_count, 2)
+
+    @patch('modules.notifier._smtp_connections', {})
+    @patch('modules.notifier.smtplib.SMTP')
+    def test_email_reconnects_dropped_smtp_connection(self, mock_smtp):
+        """Test a connection the server closed is replaced before sending"""
+        import smtplib
+
+        stale, fresh = MagicMock(), MagicMock()
+        stale.noop.side_effect = smtplib.SMTPServerDisconnected()
+        mock_smtp.side_effect = [stale, fresh]
+        self.config['email']['enabled'] = True
+        notifier = Notifier(self.config)
+
+        notifier.send_email('First', 'message', {})
+        notifier.send_email('Second', 'message', {})
+
+        self.assertEqual(mock_smtp.call_count, 2)
+        stale.close.assert_called_once()
+        self.assertEqual(stale.send_message.call_count, 1)
+        self.assertEqual(fresh.send_message.call_count, 1)
+
 
 if __name__ == '__main__':
     unittest.main()